@@ -0,0 +1,42 @@
+"""JSON helpers for the eval scripts: orjson when installed, stdlib json otherwise.
+
+dumps() always returns bytes, so JSONL sinks should be opened in binary mode.
+"""
+import json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+JSONDecodeError = json.JSONDecodeError
+
+
+def dumps(obj, indent=False, default=None, sort_keys=False):
+    """Serialize obj to UTF-8 JSON bytes.
+
+    default is called for objects neither serializer handles natively
+    (e.g. neo4j.time.Date); sort_keys gives a stable encoding for hashing.
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        return orjson.dumps(obj, default=default, option=option)
+    return json.dumps(
+        obj, indent=2 if indent else None, default=default, sort_keys=sort_keys
+    ).encode("utf-8")
+
+
+def dumps_line(obj):
+    """Serialize obj as a single JSONL record, newline included."""
+    return dumps(obj) + b"\n"
+
+
+def loads(data):
+    """Parse JSON from str or bytes."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
@@ -0,0 +1,57 @@
+import hashlib
+import os
+import sqlite3
+import threading
+
+CACHE_PATH = os.environ.get("LLM_CACHE_PATH", "./.llm_cache.sqlite")
+
+_lock = threading.Lock()
+_conn = None
+_conn_pid = None
+
+
+def _get_conn():
+    """Open the cache database lazily, once per process."""
+    global _conn, _conn_pid
+    if _conn is None or _conn_pid != os.getpid():
+        _conn = sqlite3.connect(CACHE_PATH, timeout=30, check_same_thread=False)
+        _conn.execute(
+            "CREATE TABLE IF NOT EXISTS llm_cache ("
+            "key TEXT PRIMARY KEY, model TEXT, temperature REAL, value TEXT)"
+        )
+        _conn.commit()
+        _conn_pid = os.getpid()
+    return _conn
+
+
+def make_key(model, temperature, prompt, namespace=None):
+    """Exact-match cache key for a (model, temperature, prompt) triple.
+
+    Values that are not the plain completion of that triple (tool-augmented
+    searches, per-trial samples, batched verdicts) pass a namespace, so they
+    never share a key with a chat completion or with each other.
+    """
+    raw = f"{model}|{temperature}|{prompt}"
+    if namespace is not None:
+        raw = f"{namespace}|{raw}"
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+def get(key):
+    """Return the cached completion for key, or None on a miss."""
+    with _lock:
+        row = _get_conn().execute(
+            "SELECT value FROM llm_cache WHERE key = ?", (key,)
+        ).fetchone()
+    return row[0] if row else None
+
+
+def put(key, value, model=None, temperature=None):
+    """Store a successful completion under key."""
+    with _lock:
+        conn = _get_conn()
+        conn.execute(
+            "INSERT OR REPLACE INTO llm_cache (key, model, temperature, value) VALUES (?, ?, ?, ?)",
+            (key, model, temperature, value),
+        )
+        conn.commit()
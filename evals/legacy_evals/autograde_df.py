@@ -1,60 +1,221 @@
-import pandas as pd
+import asyncio
+import json
+import os
+import re
 import litellm
 import argparse
-from evals.legacy_evals.grader_prompts import GRADER_TEMPLATE
-from multiprocessing import Pool, cpu_count
+from evals import _json, _llm_cache
+from evals.legacy_evals.grader_prompts import (
+    GRADER_TEMPLATE,
+    BATCH_GRADER_TEMPLATE,
+    BATCH_GRADER_CASE_TEMPLATE,
+)
 from tqdm import tqdm
 
+GRADER_MODEL = "openrouter/google/gemini-2.0-flash-001"
+GRADER_TEMPERATURE = 0.0
 
-def grade_row(row_data):
-    idx, row = row_data
-    question = row["original_question"]
-    predicted_answer = row["answer"]
-    gold_answer = row["true_answer"]
 
-    input_prompt = GRADER_TEMPLATE.format(
-        question=question, predicted_answer=predicted_answer, target=gold_answer
+def grader_prompt(row):
+    return GRADER_TEMPLATE.format(
+        question=row["original_question"],
+        predicted_answer=row["answer"],
+        target=row["true_answer"],
     )
 
+
+# Letters the grader prompt asks for: A = CORRECT, B = INCORRECT, C = NOT_ATTEMPTED
+GRADE_CORRECT = "A"
+GRADE_INCORRECT = "B"
+
+FAILED_ANSWERS = ("Timed Out", "Error")
+
+# Cache namespace for verdicts taken from multi-row prompts, kept apart from
+# the single-row prompt keys whose values are that prompt's literal output
+BATCHED_CACHE_NAMESPACE = "batched_verdict"
+
+
+def normalize_answer(text):
+    """Case- and whitespace-folded answer; punctuation is kept ("3.5" != "35")."""
+    return " ".join(str(text).lower().split())
+
+
+def direct_grade(row):
+    """Grade rows whose outcome is structurally determined, without an LLM call.
+
+    Returns None when the row needs the grader.
+    """
+    predicted_answer = row["answer"]
+    # Test for a missing answer explicitly: 0 / 0.0 are legitimate answers
+    if predicted_answer is None or not str(predicted_answer).strip():
+        return GRADE_INCORRECT
+    if predicted_answer in FAILED_ANSWERS or str(predicted_answer).startswith("Error:"):
+        return GRADE_INCORRECT
+    if normalize_answer(predicted_answer) == normalize_answer(row["true_answer"]):
+        return GRADE_CORRECT
+    return None
+
+
+def parse_batch_grades(output):
+    """Parse the JSON list of {idx, grade} returned for a batched prompt."""
+    match = re.search(r"\[.*\]", output, re.DOTALL)
+    if not match:
+        return {}
     try:
-        output = litellm.completion(
-            model="openrouter/google/gemini-2.0-flash-001",
-            messages=[{"role": "user", "content": input_prompt}],
-            temperature=0.0,
-        )["choices"][0]["message"]["content"]
-        return idx, output
-    except Exception as e:
-        print(f"Error processing row {idx}: {e}")
-        return idx, "Error"
+        verdicts = json.loads(match.group(0))
+    except json.JSONDecodeError:
+        return {}
+    if not isinstance(verdicts, list):
+        return {}
+    grades = {}
+    for v in verdicts:
+        if not (isinstance(v, dict) and "idx" in v and "grade" in v):
+            continue
+        # A malformed verdict only loses its own row, which is then reported as "Error"
+        try:
+            grades[int(v["idx"])] = str(v["grade"]).strip()
+        except (ValueError, TypeError):
+            continue
+    return grades
 
 
-def autograde_df(df_path, num_cpus=4):
-    # Read the dataframe
-    df = pd.read_json(df_path, lines=True)
+async def grade_batch(batch, sem):
+    """Grade a list of (idx, row) pairs with a single LLM call.
 
-    # Prepare data for parallel processing
-    row_data = list(df.iterrows())
+    Obvious hits/misses and rows already in the cache are answered locally;
+    the rest are packed into one prompt. A verdict is cached per row: under the
+    single-row prompt's key when that prompt was sent, and under a separate
+    batched-verdict key when it came from a multi-row prompt, so hits do not
+    depend on the batch size used.
+    """
+    results = []
+    pending = []
+    for idx, row in batch:
+        grade = direct_grade(row)
+        if grade is not None:
+            results.append((idx, grade))
+            continue
+        prompt = grader_prompt(row)
+        cache_key = _llm_cache.make_key(GRADER_MODEL, GRADER_TEMPERATURE, prompt)
+        batched_key = _llm_cache.make_key(
+            GRADER_MODEL, GRADER_TEMPERATURE, prompt, namespace=BATCHED_CACHE_NAMESPACE
+        )
+        cached = _llm_cache.get(cache_key)
+        if cached is None:
+            cached = _llm_cache.get(batched_key)
+        if cached is not None:
+            results.append((idx, cached))
+        else:
+            pending.append((idx, row, cache_key, batched_key))
 
-    # Use specified number of CPU cores
-    n_processes = max(1, min(num_cpus, cpu_count()))
-    print(f"Using {n_processes} processes")
+    if not pending:
+        return results
 
-    # Create process pool and process rows in parallel
-    with Pool(n_processes) as pool:
-        # Use tqdm for progress bar
-        results = list(
-            tqdm(pool.imap(grade_row, row_data), total=len(row_data), desc="Grading")
+    if len(pending) == 1:
+        input_prompt = grader_prompt(pending[0][1])
+    else:
+        cases = "\n".join(
+            BATCH_GRADER_CASE_TEMPLATE.format(
+                idx=case_idx,
+                question=row["original_question"],
+                predicted_answer=row["answer"],
+                target=row["true_answer"],
+            )
+            for case_idx, (_, row, _, _) in enumerate(pending)
         )
+        input_prompt = BATCH_GRADER_TEMPLATE.format(num_cases=len(pending), cases=cases)
+
+    try:
+        async with sem:
+            response = await litellm.acompletion(
+                model=GRADER_MODEL,
+                messages=[{"role": "user", "content": input_prompt}],
+                temperature=GRADER_TEMPERATURE,
+            )
+        output = response["choices"][0]["message"]["content"]
+        if len(pending) == 1:
+            grades = {0: output}
+        else:
+            grades = parse_batch_grades(output)
+    except Exception as e:
+        print(f"Error processing rows {[idx for idx, *_ in pending]}: {e}")
+        return results + [(idx, "Error") for idx, *_ in pending]
+
+    for case_idx, (idx, _, cache_key, batched_key) in enumerate(pending):
+        grade = grades.get(case_idx)
+        if grade is None:
+            print(f"Error processing row {idx}: no grade in batched response")
+            results.append((idx, "Error"))
+            continue
+        # Only the single-row prompt's output may live under that prompt's key
+        key = cache_key if len(pending) == 1 else batched_key
+        _llm_cache.put(key, grade, model=GRADER_MODEL, temperature=GRADER_TEMPERATURE)
+        results.append((idx, grade))
+    return results
+
+
+def load_graded(graded_path):
+    """Return {idx: grade} for rows already graded by an earlier run."""
+    graded = {}
+    if os.path.exists(graded_path):
+        with open(graded_path, "rb") as f:
+            for line in f:
+                try:
+                    entry = _json.loads(line)
+                    graded[entry["idx"]] = entry["final_grade"]
+                except (_json.JSONDecodeError, KeyError):
+                    continue
+    return graded
+
+
+GRADED_FIELDS = ("original_question", "answer", "true_answer")
 
-    # Sort results by index and extract grades
-    results.sort(key=lambda x: x[0])
-    final_grades = [grade for _, grade in results]
 
-    # Add the grades as a new column
-    df["final_grade"] = final_grades
+def iter_rows(df_path):
+    """Yield (idx, row) with only the fields the grader needs."""
+    with open(df_path, "rb") as f:
+        for idx, line in enumerate(f):
+            entry = _json.loads(line)
+            yield idx, {k: entry.get(k) for k in GRADED_FIELDS}
 
-    # Save the updated dataframe back to the same file
-    df.to_json(df_path, orient="records", lines=True)
+
+async def autograde_df(df_path, concurrency=64, batch_size=8):
+    # Resume from grades streamed by a previous, interrupted run
+    graded_path = df_path + ".graded.jsonl"
+    grades = load_graded(graded_path)
+    if grades:
+        print(f"Resuming: {len(grades)} rows already graded in {graded_path}")
+
+    # Pack rows into batches so each request grades several answers
+    row_data = [(idx, row) for idx, row in iter_rows(df_path) if idx not in grades]
+    batch_size = max(1, batch_size)
+    batches = [row_data[i:i + batch_size] for i in range(0, len(row_data), batch_size)]
+
+    # Bound the number of in-flight grading requests
+    sem = asyncio.Semaphore(max(1, concurrency))
+    print(f"Grading {len(row_data)} rows in batches of {batch_size} with up to {concurrency} concurrent requests")
+
+    tasks = [grade_batch(batch, sem) for batch in batches]
+    with open(graded_path, "ab") as graded_fp, tqdm(total=len(row_data), desc="Grading") as pbar:
+        for coro in asyncio.as_completed(tasks):
+            graded = await coro
+            for idx, grade in graded:
+                grades[idx] = grade
+                # Errors are left out of the sidecar so a rerun retries them
+                if grade != "Error":
+                    graded_fp.write(_json.dumps_line({"idx": idx, "final_grade": grade}))
+            graded_fp.flush()
+            pbar.update(len(graded))
+
+    # Stream-rewrite the input, adding final_grade to each record, then swap it into place
+    tmp_path = df_path + ".tmp"
+    with open(df_path, "rb") as inp, open(tmp_path, "wb") as out:
+        for idx, line in enumerate(inp):
+            entry = _json.loads(line)
+            entry["final_grade"] = grades[idx]
+            out.write(_json.dumps_line(entry))
+    os.replace(tmp_path, df_path)
+    os.remove(graded_path)
     print("Grading completed and results saved!")
 
 
@@ -62,8 +223,17 @@ if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Auto-grade answers in a DataFrame")
     parser.add_argument("df_path", type=str, help="Path to the DataFrame JSON file")
     parser.add_argument(
-        "--num_cpus", type=int, default=4, help="Number of CPU cores to use"
+        "--concurrency",
+        type=int,
+        default=64,
+        help="Maximum number of grading requests in flight",
+    )
+    parser.add_argument(
+        "--batch_size",
+        type=int,
+        default=8,
+        help="Number of rows graded per LLM call (1 disables batching)",
     )
 
     args = parser.parse_args()
-    autograde_df(args.df_path, args.num_cpus)
+    asyncio.run(autograde_df(args.df_path, args.concurrency, args.batch_size))
@@ -1,20 +1,39 @@
 import asyncio
-from openai import OpenAI
+from openai import AsyncOpenAI
 import time
 from typing import List, Dict, Any
-import json
 import pandas as pd
 from pathlib import Path
 import argparse
 from dotenv import load_dotenv
 import os
+import sys
 from tqdm import tqdm
-import multiprocessing as mp
-from queue import Empty
-from concurrent.futures import ProcessPoolExecutor
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+from evals import _json, _llm_cache
 
 load_dotenv()
 
+_CLIENT = None
+
+# Cache namespace of web-search answers; the trial number is appended
+WEB_SEARCH_CACHE_NAMESPACE = "openai_web_search"
+
+
+def _get_client() -> AsyncOpenAI:
+    """Return the shared OpenAI client, creating it on first use.
+
+    Keeping one client lets every request reuse the same HTTP connection
+    pool instead of reconnecting.
+    """
+    global _CLIENT
+    if _CLIENT is None:
+        _CLIENT = AsyncOpenAI(
+            api_key=os.environ.get("OPENAI_API_KEY"),
+            base_url=os.environ.get("OPENAI_BASE_URL")
+        )
+    return _CLIENT
+
 class WebSearchEvaluator:
     def __init__(self, model: str, output_path: Path, num_workers: int = 4, trial: int = 0):
         self.model = model
@@ -25,47 +44,51 @@ class WebSearchEvaluator:
         # Load existing results if any
         self.processed_questions = set()
         if self.output_path.exists():
-            with open(self.output_path, 'r') as f:
+            with open(self.output_path, 'rb') as f:
                 for line in f:
                     try:
-                        result = json.loads(line)
+                        result = _json.loads(line)
                         self.processed_questions.add(result['question'])
                     except:
                         continue
 
-    def worker_init(self):
-        """Initialize OpenAI client for each worker."""
-        # Create new client for each process
-        self.client = OpenAI(
-            api_key=os.environ.get("OPENAI_API_KEY"),
-            base_url=os.environ.get("OPENAI_BASE_URL")
-        )
-
-    def evaluate_single(self, row: pd.Series) -> Dict[str, Any]:
+    async def evaluate_single(self, row: Dict[str, Any], sem: asyncio.Semaphore) -> Dict[str, Any]:
         """Evaluate a single question with its true answer."""
         # Skip if already processed
         if row['question'] in self.processed_questions:
             return None
 
-        if not hasattr(self, 'client'):
-            self.worker_init()
-
         try:
-            start_time = time.time()
-            response = self.client.responses.create(
-                model=self.model,
-                tools=[{"type": "web_search_preview"}],
-                input=row['question']
+            # Each trial is an independent sample, so the trial is part of the key:
+            # a rerun of the same trial resumes, other trials still call the model
+            cache_key = _llm_cache.make_key(
+                self.model,
+                None,
+                row['question'],
+                namespace=f"{WEB_SEARCH_CACHE_NAMESPACE}/trial-{self.trial}",
             )
-            end_time = time.time()
+            answer = _llm_cache.get(cache_key)
             result = {
                 "question": row['question'],
                 "true_answer": row['true_answer'],
-                "answer": response.output_text,
                 "model": self.model,
-                "time_taken": end_time - start_time,
-                "timestamp": time.strftime("%Y-%m-%d %H:%M:%S")
             }
+            if answer is None:
+                start_time = time.time()
+                async with sem:
+                    response = await _get_client().responses.create(
+                        model=self.model,
+                        tools=[{"type": "web_search_preview"}],
+                        input=row['question']
+                    )
+                answer = response.output_text
+                # Latency is only meaningful for answers that came from the model
+                result["time_taken"] = time.time() - start_time
+                _llm_cache.put(cache_key, answer, model=self.model)
+            else:
+                result["cached"] = True
+            result["answer"] = answer
+            result["timestamp"] = time.strftime("%Y-%m-%d %H:%M:%S")
             return result
         except Exception as e:
             return {
@@ -79,29 +102,28 @@ class WebSearchEvaluator:
 
     def save_result(self, result: Dict[str, Any]) -> None:
         """Save a single result to the JSONL file."""
-        with open(self.output_path, 'a') as f:
-            f.write(json.dumps(result) + '\n')
+        self._out.write(_json.dumps_line(result))
+        self._out.flush()
+
+    async def _evaluate_all(self, rows: List[Dict[str, Any]]) -> None:
+        sem = asyncio.Semaphore(max(1, self.num_workers))
+        tasks = [self.evaluate_single(row, sem) for row in rows]
+
+        # Create progress bar for total rows
+        with tqdm(total=len(rows), desc="Processing questions") as pbar:
+            # Process results as they complete
+            for coro in asyncio.as_completed(tasks):
+                result = await coro
+                if result is not None:  # Only save if not already processed
+                    self.save_result(result)
+                pbar.update(1)
 
     def evaluate_batch(self, df: pd.DataFrame) -> None:
-        """Evaluate questions in parallel using multiple workers."""
-        with ProcessPoolExecutor(
-            max_workers=self.num_workers,
-            initializer=self.worker_init
-        ) as executor:
-            # Convert DataFrame rows to list of Series
-            rows = [row for _, row in df.iterrows()]
-
-            # Create progress bar for total rows
-            with tqdm(total=len(rows), desc="Processing questions") as pbar:
-                # Submit all tasks
-                futures = [executor.submit(self.evaluate_single, row) for row in rows]
-
-                # Process results as they complete
-                for future in futures:
-                    result = future.result()
-                    if result is not None:  # Only save if not already processed
-                        self.save_result(result)
-                    pbar.update(1)
+        """Evaluate questions concurrently, with at most num_workers requests in flight."""
+        rows = df[['question', 'true_answer']].to_dict('records')
+        # One handle for the whole run instead of reopening per result
+        with open(self.output_path, 'ab') as self._out:
+            asyncio.run(self._evaluate_all(rows))
 
 def parse_args():
     parser = argparse.ArgumentParser(description='Evaluate questions using GPT-4 with web search')
@@ -113,8 +135,8 @@ def parse_args():
     parser.add_argument('--model', type=str,
                       default=os.getenv("LITELLM_EVAL_MODEL_ID", os.getenv("LITELLM_MODEL_ID", "gpt-4o-mini")),
                       help='Model to use for evaluation')
-    parser.add_argument('--num_workers', type=int, default=4,
-                      help='Number of parallel workers (default: 4)')
+    parser.add_argument('--num_workers', type=int, default=32,
+                      help='Maximum number of concurrent requests (default: 32)')
     parser.add_argument('--trial', type=int, default=0,
                       help='Trial number for this evaluation run (default: 0)')
     return parser.parse_args()
@@ -143,17 +165,21 @@ def main():
     )
 
     # Run evaluation
-    print(f"Starting evaluation with model {args.model} using {args.num_workers} workers...")
+    print(f"Starting evaluation with model {args.model} with up to {args.num_workers} concurrent requests...")
     evaluator.evaluate_batch(df)
     print(f"Results saved to {output_path}")
 
-    # Load and display summary
-    results_df = pd.read_json(output_path, lines=True)
+    # Tally the summary in a single pass over the results file
+    total = successful = 0
+    with open(output_path, 'rb') as f:
+        for line in f:
+            total += 1
+            successful += _json.loads(line).get('answer') is not None
     print("\nResults summary:")
     print(f"Model: {args.model}")
-    print(f"Total evaluations: {len(results_df)}")
-    print(f"Successful evaluations: {len(results_df[~results_df['answer'].isna()])}")
-    print(f"Failed evaluations: {len(results_df[results_df['answer'].isna()])}")
+    print(f"Total evaluations: {total}")
+    print(f"Successful evaluations: {successful}")
+    print(f"Failed evaluations: {total - successful}")
 
 if __name__ == "__main__":
     main()
@@ -1,18 +1,20 @@
 import argparse
+import atexit
 import datetime
-import json
 import os
+import sys
 import threading
 import time
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from itertools import islice
 from pathlib import Path
 
-import datasets
 import pandas as pd
-from datasets import Dataset
 from dotenv import load_dotenv
 from tqdm import tqdm
 from opendeepsearch import OpenDeepSearchTool
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+from evals import _json
 
 from smolagents import (
     AgentError,
@@ -28,6 +30,18 @@ from smolagents.agents import ActionStep
 load_dotenv()
 
 APPEND_ANSWER_LOCK = threading.Lock()
+# Per-request timeout handed to the model client, so a slow call is aborted instead of leaking a thread.
+TIMEOUT_SECONDS = 300  # 5 minutes timeout
+# Open answer files, keyed by path; guarded by APPEND_ANSWER_LOCK.
+_ANSWER_FILES = {}
+
+
+@atexit.register
+def _close_answer_files():
+    with APPEND_ANSWER_LOCK:
+        for fp in _ANSWER_FILES.values():
+            fp.close()
+        _ANSWER_FILES.clear()
 
 
 def parse_arguments():
@@ -90,9 +104,8 @@ def load_eval_dataset(eval_tasks: list):
     eval_ds = {}
     for task_path in eval_tasks:
         task_name = task_path.split("/")[-1][:-4]
-        df = pd.read_csv(task_path)
-        dataset = Dataset.from_pandas(df)
-        eval_ds[task_name] = dataset
+        df = pd.read_csv(task_path, usecols=["question", "true_answer"])
+        eval_ds[task_name] = df.to_dict(orient="records")
     return eval_ds
 
 
@@ -104,68 +117,83 @@ def serialize_agent_error(obj):
 
 
 def append_answer(entry: dict, jsonl_file: str) -> None:
-    jsonl_file = Path(jsonl_file)
-    jsonl_file.parent.mkdir(parents=True, exist_ok=True)
-    with APPEND_ANSWER_LOCK, open(jsonl_file, "a", encoding="utf-8") as fp:
-        fp.write(json.dumps(entry) + "\n")
-    assert os.path.exists(jsonl_file), "File not found!"
+    line = _json.dumps_line(entry)
+    with APPEND_ANSWER_LOCK:
+        fp = _ANSWER_FILES.get(jsonl_file)
+        if fp is None:
+            path = Path(jsonl_file)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fp = _ANSWER_FILES[jsonl_file] = open(path, "ab")
+        fp.write(line)
+        fp.flush()
 
 
-def run_with_timeout(func, timeout):
-    with ThreadPoolExecutor(max_workers=1) as executor:
-        future = executor.submit(func)
-        try:
-            return future.result(timeout=timeout)
-        except TimeoutError:
-            return "Timed Out"
+# Agents are reused per worker thread; ThreadPoolExecutor keeps its threads alive across tasks.
+_THREAD_AGENTS = threading.local()
 
 
-def answer_single_question(example, model, answers_file, action_type, search_model_id=None):
+def _build_agent(model, action_type, search_model_id=None):
     if action_type == "vanilla":
-        agent = model
+        return model
     elif action_type == "codeact":
-        agent = CodeAgent(
+        return CodeAgent(
             tools=[OpenDeepSearchTool(model_name=search_model_id or model.model_id)],
             model=model,
             additional_authorized_imports=["numpy"],
             max_steps=15,
         )
     elif action_type == "tool-calling":
-        agent = ToolCallingAgent(
+        return ToolCallingAgent(
             tools=[OpenDeepSearchTool(model_name=search_model_id or model.model_id), PythonInterpreterTool()],
             model=model,
             additional_authorized_imports=["numpy"],
             max_steps=15,
         )
 
+
+def _get_thread_agent(model, action_type, search_model_id=None):
+    """Return this thread's agent, building it on first use."""
+    agents = getattr(_THREAD_AGENTS, "agents", None)
+    if agents is None:
+        agents = _THREAD_AGENTS.agents = {}
+    key = (id(model), action_type, search_model_id)
+    if key not in agents:
+        agents[key] = _build_agent(model, action_type, search_model_id)
+    return agents[key]
+
+
+def _drop_thread_agent(model, action_type, search_model_id=None):
+    agents = getattr(_THREAD_AGENTS, "agents", {})
+    agents.pop((id(model), action_type, search_model_id), None)
+
+
+def answer_single_question(example, model, answers_file, action_type, search_model_id=None):
+    agent = _get_thread_agent(model, action_type, search_model_id)
+
     augmented_question = example["question"]
     start_time = time.time()
-    TIMEOUT_SECONDS = 300  # 5 minutes timeout
 
     try:
         if action_type == "vanilla":
-            def get_vanilla_response():
-                response = agent([{"role": "user", "content": augmented_question}])
-                return response.content, agent.last_output_token_count
-            
-            answer, token_count = run_with_timeout(get_vanilla_response, TIMEOUT_SECONDS)
+            response = agent([{"role": "user", "content": augmented_question}])
+            answer, token_count = response.content, agent.last_output_token_count
             intermediate_steps = answer
         else:
-            def get_agent_response():
-                response = str(agent.run(augmented_question))
-                token_count = agent.monitor.get_total_token_counts()
-                # Remove memory from logs to make them more compact.
-                for step in agent.memory.steps:
-                    if isinstance(step, ActionStep):
-                        step.agent_memory = None
-                return response, token_count, str(agent.memory.steps)
-            
-            answer, token_count, intermediate_steps = run_with_timeout(get_agent_response, TIMEOUT_SECONDS)
-
-        end_time = time.time()
+            # reset=True (the default) clears the previous question's memory and token counts
+            answer = str(agent.run(augmented_question, reset=True))
+            token_count = agent.monitor.get_total_token_counts()
+            # Remove memory from logs to make them more compact.
+            for step in agent.memory.steps:
+                if isinstance(step, ActionStep):
+                    step.agent_memory = None
+            intermediate_steps = str(agent.memory.steps)
     except Exception as e:
         print("Error on ", augmented_question, e)
+        answer = f"Error: {e}"
+        token_count = None
         intermediate_steps = []
+        # The failed run may still hold the agent; build a fresh one for the next question
+        _drop_thread_agent(model, action_type, search_model_id)
     end_time = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
     annotated_example = {
         "model_id": model.model_id,
@@ -204,21 +232,31 @@ def answer_questions(
         for trial in range(num_trials):
             file_name = f"{task_dir}/{model_id.replace('/', '__')}__{action_type}__{task}__trial{trial}.jsonl"
             print(f"Starting processing trial {trial + 1}/{num_trials} and writing output to '{file_name}'")
-            answered_questions = []
+            answered_questions = set()
             if os.path.exists(file_name):
-                with open(file_name, "r") as f:
+                with open(file_name, "rb") as f:
                     for line in f:
-                        answered_questions.append(json.loads(line)["original_question"])
+                        answered_questions.add(_json.loads(line)["original_question"])
             examples_todo = [example for example in eval_ds[task] if example["question"] not in answered_questions]
             print(f"Launching {parallel_workers} parallel workers.")
 
-            with ThreadPoolExecutor(max_workers=parallel_workers) as exe:
-                futures = [
-                    exe.submit(answer_single_question, example, model, file_name, action_type, search_model_id) 
-                    for example in examples_todo
-                ]
-                for f in tqdm(as_completed(futures), total=len(examples_todo), desc="Processing tasks"):
-                    f.result()
+            # Keep at most 2 * parallel_workers tasks queued instead of submitting every example up front
+            pending_examples = iter(examples_todo)
+            with ThreadPoolExecutor(max_workers=parallel_workers) as exe, \
+                    tqdm(total=len(examples_todo), desc="Processing tasks") as pbar:
+                inflight = {
+                    exe.submit(answer_single_question, example, model, file_name, action_type, search_model_id)
+                    for example in islice(pending_examples, 2 * parallel_workers)
+                }
+                while inflight:
+                    done, inflight = wait(inflight, return_when=FIRST_COMPLETED)
+                    for f in done:
+                        f.result()
+                        pbar.update(1)
+                    for example in islice(pending_examples, len(done)):
+                        inflight.add(
+                            exe.submit(answer_single_question, example, model, file_name, action_type, search_model_id)
+                        )
 
             print("All tasks processed.")
 
@@ -233,10 +271,11 @@ if __name__ == "__main__":
             args.model_id,
             max_completion_tokens=8192,
             temperature=0.2,
+            timeout=TIMEOUT_SECONDS,
             # api_key=os.getenv("OPENROUTER_API_KEY"),
         )
     else:
-        model = HfApiModel(args.model_id, provider="together", max_tokens=8192)
+        model = HfApiModel(args.model_id, provider="together", max_tokens=8192, timeout=TIMEOUT_SECONDS)
 
     answer_questions(
         eval_ds,
@@ -1,8 +1,16 @@
+import asyncio
+import logging
+import os
+import sys
+from pathlib import Path
+import httpx
 import litellm
-from multiprocessing import Pool
-import pandas as pd
 from tqdm import tqdm
 import argparse
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+from evals import _json
+
+logger = logging.getLogger(__name__)
 
 input_prompt = """You are a precise answer extractor. Your job is to read a question and a detailed answer, then output ONLY the final answer without any explanation.
 
@@ -24,56 +32,124 @@ Question: {question}
 Detailed Answer: {detailed_answer}
 Final Answer:"""
 
-def process_row(row):
+# The examples above never change; split them off once so each row only appends its own question.
+_PROMPT_PREFIX = input_prompt.split("Now do this:\n")[0]
+
+def build_prompt(question, detailed_answer):
+    return f"{_PROMPT_PREFIX}Now do this:\nQuestion: {question}\nDetailed Answer: {detailed_answer}\nFinal Answer:"
+
+async def process_row(row):
     """Process a single row using litellm."""
     try:
-        output = litellm.completion(
+        output = await litellm.acompletion(
             model="openrouter/google/gemini-2.0-flash-001",
             messages=[{
                 "role": "user", 
-                "content": input_prompt.format(
-                    question=row['question'], 
-                    detailed_answer=row['original_answer']
-                )
+                "content": build_prompt(row['question'], row['original_answer'])
             }],
-            temperature=0.3
+            temperature=0.3,
+            # Let litellm back off and retry rate limits / 5xx instead of dropping the row
+            num_retries=3
         )
         return output['choices'][0]['message']['content']
     except Exception as e:
-        print(f"Error processing row: {e}")
+        logger.warning("Error processing row %r: %s", row['question'][:80], e)
         return None
 
-def process_dataframe(df, num_workers=4):
-    """Process the entire dataframe using a pool of workers."""
-    with Pool(num_workers) as pool:
-        # Use tqdm to show progress bar
-        results = list(tqdm(
-            pool.imap(process_row, [row for _, row in df.iterrows()]),
-            total=len(df)
-        ))
-    
-    # Add results as a new column
-    df['processed_output'] = results
-    return df
+async def _process_rows(rows, total, on_result, concurrency):
+    """Run process_row over a lazy iterable of rows with a fixed pool of workers.
+
+    Only `concurrency` coroutines exist at a time, so rows are pulled from
+    the iterable as capacity frees up instead of being materialized upfront;
+    the pool itself bounds the requests in flight.
+    on_result(row, output) is called as soon as each row completes.
+    """
+    rows = iter(rows)
+
+    # One pooled client for every request, so keep-alive connections are reused
+    async with httpx.AsyncClient(
+        limits=httpx.Limits(max_connections=max(1, concurrency), max_keepalive_connections=max(1, concurrency)),
+        timeout=120,
+    ) as client:
+        litellm.aclient_session = client
+        try:
+            with tqdm(total=total) as pbar:
+                async def worker():
+                    for row in rows:
+                        on_result(row, await process_row(row))
+                        pbar.update(1)
+
+                await asyncio.gather(*(worker() for _ in range(max(1, concurrency))))
+        finally:
+            litellm.aclient_session = None
+
+def load_processed_questions(output_file):
+    """Questions already answered in output_file by an earlier run.
+
+    Rows without an answer (failures written by older runs) are not counted,
+    so they are retried.
+    """
+    processed = set()
+    if os.path.exists(output_file):
+        with open(output_file, 'rb') as f:
+            for line in f:
+                try:
+                    entry = _json.loads(line)
+                    if entry.get('answer') is not None:
+                        processed.add(entry['question'])
+                except (_json.JSONDecodeError, KeyError):
+                    continue
+    return processed
+
+def iter_rows(input_file, skip_questions=frozenset()):
+    """Stream JSONL records, renaming 'answer' to 'original_answer'."""
+    with open(input_file, 'rb') as f:
+        for line in f:
+            row = _json.loads(line)
+            if row['question'] in skip_questions:
+                continue
+            row['original_answer'] = row.pop('answer', None)
+            yield row
+
+def process_file(input_file, output_file, concurrency=64):
+    """Process every row of input_file, appending each result to output_file as it completes.
+
+    Rows whose question is already answered in output_file are skipped, so an
+    interrupted run can be resumed. Failed rows are not written, so the next
+    run retries them.
+    """
+    processed = load_processed_questions(output_file)
+    if processed:
+        print(f"Skipping {len(processed)} rows already in {output_file}")
+    total = sum(1 for _ in iter_rows(input_file, processed))
+
+    failed = 0
+
+    with open(output_file, 'ab') as out:
+        def write_result(row, output):
+            nonlocal failed
+            if output is None:
+                failed += 1
+                return
+            # Store the extracted answer in the 'answer' column
+            out.write(_json.dumps_line({**row, 'answer': output}))
+            out.flush()
+
+        asyncio.run(_process_rows(iter_rows(input_file, processed), total, write_result, concurrency))
+
+    if failed:
+        print(f"{failed} rows failed and were not saved; rerun to retry them")
 
 if __name__ == '__main__':
-    parser = argparse.ArgumentParser(description='Process a CSV file using litellm in parallel')
-    parser.add_argument('input_file', type=str, help='Path to the input CSV file')
-    parser.add_argument('--workers', type=int, default=4, help='Number of worker processes (default: 4)')
+    parser = argparse.ArgumentParser(description='Process a JSONL file using litellm in parallel')
+    parser.add_argument('input_file', type=str, help='Path to the input JSONL file')
+    parser.add_argument('--concurrency', type=int, default=64, help='Maximum number of requests in flight (default: 64)')
     
     args = parser.parse_args()
+    logging.basicConfig(level=logging.WARNING, format="%(levelname)s %(name)s: %(message)s")
     
-    # Load and process the dataframe
-    df = pd.read_json(args.input_file, lines=True)
-    
-    # Rename 'answer' to 'original_answer'
-    df = df.rename(columns={'answer': 'original_answer'})
-    
-    # Process the dataframe and store results in 'answer' column
-    processed_df = process_dataframe(df, num_workers=args.workers)
-    processed_df = processed_df.rename(columns={'processed_output': 'answer'})
-    
-    # Save to output file (adding '_processed' before the extension)
-    output_file = args.input_file.rsplit('.', 1)[0] + '_processed.' + args.input_file.rsplit('.', 1)[1]
-    processed_df.to_csv(output_file, index=False)
+    # Save next to the input as <stem>_processed.jsonl, matching the JSONL writer
+    input_path = Path(args.input_file)
+    output_file = str(input_path.with_name(input_path.stem + '_processed.jsonl'))
+    process_file(args.input_file, output_file, concurrency=args.concurrency)
     print(f"Processed data saved to: {output_file}")
@@ -81,3 +81,25 @@ C: NOT_ATTEMPTED
 
 Just return the letters "A", "B", or "C", with no text around it.
 """.strip()
+
+
+BATCH_GRADER_TEMPLATE = GRADER_TEMPLATE.split("Here is a new example.")[0] + """
+Here are {num_cases} new examples, each labelled with a case index. Grade each one independently. Don't apologize or correct yourself if there was a mistake; we are just trying to grade the answers.
+{cases}
+
+Grade the predicted answer of each new question as one of:
+A: CORRECT
+B: INCORRECT
+C: NOT_ATTEMPTED
+
+Return a JSON list with one object per case, e.g. [{{"idx": 0, "grade": "A"}}, {{"idx": 1, "grade": "C"}}], with no text around it.
+""".strip()
+
+BATCH_GRADER_CASE_TEMPLATE = """
+Case {idx}:
+```
+Question: {question}
+Gold target: {target}
+Predicted answer: {predicted_answer}
+```
+""".rstrip()
@@ -8,13 +8,29 @@ Architecture: Question → WebSearch → TemporalKG Context Injection → Final
 """
 
 import os
+import sys
 import json
 import time
 import re
-from typing import Dict, List, Any, Tuple
+import asyncio
+import functools
+from typing import Dict, Iterator, List, Any, Tuple
 from dataclasses import dataclass
 import openai
 
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from evals import _json, _llm_cache
+
 # Use ACTUAL OpenDeepSearch library
 try:
     from opendeepsearch import OpenDeepSearchTool
@@ -28,6 +44,474 @@ except ImportError:
     OPENDEEPSEARCH_AVAILABLE = False
 
 
+# Fusion step: rewrite the web-search answer with the Neo4j temporal context
+FUSION_MODEL = "gpt-3.5-turbo"
+FUSION_TEMPERATURE = 0.0
+FUSION_MAX_TOKENS = 250
+FUSION_SYSTEM_MESSAGE = {
+    "role": "system",
+    "content": "Answer using the web results and database timeline, with accurate dates and order.",
+}
+# Prompt budget: characters of each input embedded in the fusion prompt
+FUSION_BASE_RESPONSE_CHARS = 800
+FUSION_CONTEXT_CHARS = 600
+
+# Date/time references and specific entities (capitalized words, numbers),
+# as one alternation so a text is scanned once. Full dates come first so they
+# win over their year; entities come last, and response_stats() credits the
+# entities hidden inside date, year and capitalized month matches. ASCII
+# matching gives the cheap byte-style \b/\d checks without encoding responses.
+RESPONSE_SCAN_RE = re.compile(
+    r"(?P<date>\b\d{1,2}[\/\-]\d{1,2}[\/\-]\d{4}\b)"  # Dates
+    r"|(?P<year>\b\d{4}\b)"  # Years (2020, 2021, etc.)
+    r"|(?P<month>\b(?i:january|february|march|april|may|june|july|august|september|october|november|december)\b)"
+    r"|(?P<quarter>\b(?i:q[1-4])\b)"  # Quarters
+    r"|(?P<entity>\b[A-Z][a-z]+\b|\b\d+\b)",
+    re.ASCII,
+)
+DIGITS_RE = re.compile(r"\d+", re.ASCII)
+
+
+# Words counted as temporal keywords, matched per token (set lookup)
+TEMPORAL_KEYWORDS = frozenset(
+    {
+        "chronological",
+        "timeline",
+        "sequence",
+        "first",
+        "then",
+        "next",
+        "before",
+        "after",
+        "during",
+        "subsequently",
+        "followed by",
+        "earlier",
+        "later",
+        "meanwhile",
+        "simultaneously",
+        "previously",
+        "afterwards",
+    }
+)
+
+# Substrings scored by evaluate_temporal_accuracy / evaluate_context_relevance
+TEMPORAL_VOCABULARY = (
+    "chronological",
+    "timeline",
+    "sequence",
+    "first",
+    "then",
+    "next",
+    "before",
+    "after",
+    "during",
+    "subsequently",
+    "followed by",
+)
+SEQUENCE_INDICATORS = ("first", "second", "then", "next", "finally", "subsequently")
+SPECIFIC_ENTITIES = ("covid", "cust_", "customer", "brazil", "france", "who", "cdc")
+CONTEXT_INDICATORS = ("database", "records show", "timeline indicates", "data shows")
+REPORT_CONTEXT_INDICATORS = CONTEXT_INDICATORS + ("according to our data",)
+RELEVANCE_TEMPORAL_WORDS = (
+    "timeline",
+    "sequence",
+    "chronological",
+    "during",
+    "before",
+    "after",
+)
+
+# Every substring the scorers look for, found in one pass per response
+SCORED_KEYWORDS = frozenset(
+    TEMPORAL_VOCABULARY
+    + SEQUENCE_INDICATORS
+    + SPECIFIC_ENTITIES
+    + REPORT_CONTEXT_INDICATORS
+    + RELEVANCE_TEMPORAL_WORDS
+)
+
+if ahocorasick is not None:
+    KEYWORD_AUTOMATON = ahocorasick.Automaton()
+    for keyword in SCORED_KEYWORDS:
+        KEYWORD_AUTOMATON.add_word(keyword, keyword)
+    KEYWORD_AUTOMATON.make_automaton()
+
+
+def find_keywords(text_lower: str) -> frozenset:
+    """Which SCORED_KEYWORDS occur in text_lower.
+
+    Uses an Aho-Corasick automaton (pyahocorasick) when installed, so the
+    text is walked once for all keywords.
+    """
+    if ahocorasick is not None:
+        return frozenset(keyword for _, keyword in KEYWORD_AUTOMATON.iter(text_lower))
+    return frozenset(keyword for keyword in SCORED_KEYWORDS if keyword in text_lower)
+
+
+@dataclass(frozen=True)
+class ResponseStats:
+    """Per-response values shared by the scoring and analysis passes."""
+
+    keywords: frozenset
+    words: Tuple[str, ...]
+    temporal_words: Tuple[str, ...]
+    date_references: Tuple[str, ...]
+    date_kinds: frozenset
+    entities: Tuple[str, ...]
+
+
+@functools.lru_cache(maxsize=256)
+def response_stats(text: str) -> ResponseStats:
+    """Lowercase, tokenize and scan a response once.
+
+    Each response is scored and then analyzed for the report, so the result
+    is memoized per text. A full date also yields its year, matching the
+    counts of the former separate year/month/date/quarter scans.
+    """
+    words = tuple(text.split())
+    date_references = []
+    date_kinds = set()
+    entities = []
+    for match in RESPONSE_SCAN_RE.finditer(text):
+        kind = match.lastgroup
+        token = match.group()
+        if kind == "entity":
+            entities.append(token)
+            continue
+        date_references.append(token)
+        date_kinds.add(kind)
+        if kind == "date":
+            date_references.append(token[-4:])
+            date_kinds.add("year")
+            entities.extend(DIGITS_RE.findall(token))
+        elif kind == "year":
+            entities.append(token)
+        elif kind == "month" and token[0].isupper() and token[1:].islower():
+            entities.append(token)
+    return ResponseStats(
+        keywords=find_keywords(text.lower()),
+        words=words,
+        temporal_words=tuple(w for w in words if w.lower() in TEMPORAL_KEYWORDS),
+        date_references=tuple(date_references),
+        date_kinds=frozenset(date_kinds),
+        entities=tuple(entities),
+    )
+
+
+def analyze_response_differences(
+    baseline: str, enhanced: str, context_added: bool
+) -> Dict[str, Any]:
+    """Analyze detailed differences between baseline and enhanced responses"""
+
+    # Basic metrics
+    baseline_stats = response_stats(baseline)
+    enhanced_stats = response_stats(enhanced)
+    baseline_words = baseline_stats.words
+    enhanced_words = enhanced_stats.words
+
+    # Temporal keywords analysis
+    baseline_temporal = list(baseline_stats.temporal_words)
+    enhanced_temporal = list(enhanced_stats.temporal_words)
+
+    # Date/time patterns
+    baseline_dates = list(baseline_stats.date_references)
+    enhanced_dates = list(enhanced_stats.date_references)
+
+    # Specific entities (proper nouns, numbers)
+    baseline_entities = list(baseline_stats.entities)
+    enhanced_entities = list(enhanced_stats.entities)
+
+    # Key differences
+    key_differences = []
+
+    if len(enhanced_temporal) > len(baseline_temporal):
+        key_differences.append(
+            f"Enhanced response uses {len(enhanced_temporal) - len(baseline_temporal)} more temporal keywords"
+        )
+
+    if len(enhanced_dates) > len(baseline_dates):
+        key_differences.append(
+            f"Enhanced response includes {len(enhanced_dates) - len(baseline_dates)} more date/time references"
+        )
+
+    if len(enhanced_entities) > len(baseline_entities):
+        key_differences.append(
+            f"Enhanced response mentions {len(enhanced_entities) - len(baseline_entities)} more specific entities"
+        )
+
+    if len(enhanced_words) > len(baseline_words):
+        key_differences.append(
+            f"Enhanced response is {len(enhanced_words) - len(baseline_words)} words longer with more detail"
+        )
+
+    if context_added:
+        key_differences.append(
+            "Temporal context from Neo4j database was successfully integrated"
+        )
+
+    # Context integration indicators
+    has_context_integration = not enhanced_stats.keywords.isdisjoint(
+        REPORT_CONTEXT_INDICATORS
+    )
+
+    if has_context_integration:
+        key_differences.append("Response explicitly references database/temporal data")
+
+    return {
+        "baseline_length": len(baseline_words),
+        "enhanced_length": len(enhanced_words),
+        "baseline_temporal_words": baseline_temporal,
+        "enhanced_temporal_words": enhanced_temporal,
+        "baseline_dates": baseline_dates,
+        "enhanced_dates": enhanced_dates,
+        "baseline_entities": baseline_entities,
+        "enhanced_entities": enhanced_entities,
+        "key_differences": key_differences,
+        "word_length_increase": len(enhanced_words) - len(baseline_words),
+        "temporal_word_increase": len(enhanced_temporal) - len(baseline_temporal),
+        "has_context_integration": has_context_integration,
+    }
+
+
+def temporal_accuracy_score(
+    temporal_word_count: int,
+    date_kind_count: int,
+    sequence_count: int,
+    entity_count: int,
+    context_integration: bool,
+) -> float:
+    """Weighted temporal accuracy from a response's per-category match counts"""
+    accuracy_score = 0.0
+
+    # 1. Temporal vocabulary (25%)
+    accuracy_score += min(1.0, temporal_word_count / 4) * 0.25
+
+    # 2. Date/time specificity (30%)
+    accuracy_score += min(1.0, 0.25 * date_kind_count) * 0.30
+
+    # 3. Sequential structure (20%)
+    accuracy_score += min(1.0, sequence_count / 3) * 0.20
+
+    # 4. Specific entity references (25%) - should be higher with temporal context
+    accuracy_score += min(1.0, entity_count / 3) * 0.25
+
+    # Bonus for temporal context integration
+    if context_integration:
+        accuracy_score += 0.1  # 10% bonus for context integration
+
+    return min(1.0, accuracy_score)
+
+
+# On-disk cache namespace of TemporalKGTool contexts
+TEMPORAL_CONTEXT_CACHE_NAMESPACE = "temporal_kg_context"
+
+# Model used by both ODS systems, and the cache namespace of their answers
+ODS_MODEL = "openrouter/google/gemini-2.0-flash-001"
+ODS_CACHE_NAMESPACE = "ods_web_search"
+
+# Ground-truth fields the evaluator reads; the rest of each record is dropped on load
+GROUND_TRUTH_FIELDS = ("question", "type", "domain", "neo4j_query")
+
+# Seconds between status checks of a submitted OpenAI batch
+BATCH_POLL_SECONDS = 30
+
+# Characters of each response / temporal context shown in the report
+REPORT_PREVIEW_CHARS = 500
+REPORT_CONTEXT_PREVIEW_CHARS = 200
+
+# Buffer size for the report file, so it is written in a few large syscalls
+WRITE_BUFFER_SIZE = 1 << 20
+
+# Curated report templates, rendered with format_map
+REPORT_HEADER_TEMPLATE = """
+        <!DOCTYPE html>
+        <html>
+        <head>
+            <title>ODS vs ODS+TemporalKG Detailed Comparison Report</title>
+            <style>
+                body {{ font-family: 'Segoe UI', Arial, sans-serif; margin: 20px; line-height: 1.6; background: #f5f5f5; }}
+                .container {{ max-width: 1200px; margin: 0 auto; background: white; padding: 20px; border-radius: 10px; box-shadow: 0 2px 10px rgba(0,0,0,0.1); }}
+                .header {{ background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); color: white; padding: 30px; margin: -20px -20px 30px -20px; border-radius: 10px 10px 0 0; text-align: center; }}
+                .summary {{ background: linear-gradient(135deg, #f093fb 0%, #f5576c 100%); color: white; padding: 20px; border-radius: 8px; margin-bottom: 30px; }}
+                .effectiveness {{ background: {insight_color}; color: white; padding: 20px; border-radius: 8px; margin-bottom: 30px; text-align: center; }}
+                .architecture {{ background: #e3f2fd; padding: 20px; border-radius: 8px; margin-bottom: 30px; }}
+                .comparison-section {{ margin-bottom: 30px; }}
+            </style>
+        </head>
+        <body>
+            <div class="container">
+                <div class="header">
+                    <h1>🎯 ODS vs ODS+TemporalKG Detailed Comparison</h1>
+                    <p>Comprehensive evaluation showing exactly how TemporalKG enhances responses</p>
+                </div>
+                
+                <div class="summary">
+                    <h2 style="margin-top: 0;">📊 Overall Enhancement Results</h2>
+                    <div style="display: grid; grid-template-columns: repeat(auto-fit, minmax(200px, 1fr)); gap: 20px; margin-top: 20px;">
+                        <div style="text-align: center;">
+                            <h3 style="margin: 0; font-size: 2em;">{context_addition_rate:.1%}</h3>
+                            <p style="margin: 5px 0 0 0;">Context Addition Rate</p>
+                        </div>
+                        <div style="text-align: center;">
+                            <h3 style="margin: 0; font-size: 2em;">{avg_accuracy_improvement:+.3f}</h3>
+                            <p style="margin: 5px 0 0 0;">Avg Accuracy Improvement</p>
+                        </div>
+                        <div style="text-align: center;">
+                            <h3 style="margin: 0; font-size: 2em;">{success_rate:.1%}</h3>
+                            <p style="margin: 5px 0 0 0;">Enhancement Success Rate</p>
+                        </div>
+                        <div style="text-align: center;">
+                            <h3 style="margin: 0; font-size: 2em;">{avg_context_relevance:.3f}</h3>
+                            <p style="margin: 5px 0 0 0;">Avg Context Relevance</p>
+                        </div>
+                    </div>
+                </div>
+                
+                <div class="effectiveness">
+                    <h2 style="margin-top: 0;">🏆 Enhancement Effectiveness: {effectiveness}</h2>
+                    <p style="font-size: 1.1em; margin: 0;">{key_insight}</p>
+                </div>
+                
+                <div class="architecture">
+                    <h2 style="color: #1976d2; margin-top: 0;">🔄 System Architecture Comparison</h2>
+                    <div style="display: grid; grid-template-columns: 1fr 1fr; gap: 20px;">
+                        <div>
+                            <h4 style="color: #6c757d;">🌐 Baseline System</h4>
+                            <p style="margin: 0;">Question → ODS WebSearch → Response</p>
+                        </div>
+                        <div>
+                            <h4 style="color: #28a745;">🕐 Enhanced System</h4>
+                            <p style="margin: 0;">Question → ODS WebSearch → <strong>TemporalKG Context Injection</strong> → Enhanced Response</p>
+                        </div>
+                    </div>
+                </div>
+                
+                <h2>📋 Detailed Question-by-Question Comparisons</h2>
+                <div class="comparison-section">"""
+REPORT_SECTION_TEMPLATE = """
+    <div style="margin-bottom: 40px; border: 2px solid #ddd; border-radius: 10px; padding: 20px;">
+        <h3 style="background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); color: white; padding: 15px; margin: -20px -20px 20px -20px; border-radius: 8px 8px 0 0;">
+            📝 Question {number}: {question}
+        </h3>
+        <p style="margin: 0 0 20px 0; color: #666; font-style: italic;">
+            Type: {question_type} | Domain: {domain} | 
+            Context Added: <span style="color: {context_color};">
+                {context_label}
+            </span>
+        </p>
+        
+        <div style="display: grid; grid-template-columns: 1fr 1fr; gap: 20px; margin-bottom: 20px;">
+            <div style="background: #f8f9fa; padding: 20px; border-radius: 8px; border-left: 4px solid #6c757d;">
+                <h4 style="color: #6c757d; margin-top: 0;">🌐 Baseline: ODS + WebSearch Only</h4>
+                <div style="background: white; padding: 15px; border-radius: 4px; margin: 10px 0; border: 1px solid #dee2e6; font-size: 14px; line-height: 1.4;">
+                    {baseline_preview}
+                </div>
+                <div style="background: #e9ecef; padding: 10px; border-radius: 4px; font-size: 12px;">
+                    <strong>Length:</strong> {baseline_length} words<br>
+                    <strong>Temporal Keywords:</strong> {baseline_temporal}<br>
+                    <strong>Accuracy Score:</strong> {baseline_accuracy:.3f}
+                </div>
+            </div>
+            
+            <div style="background: #e8f5e8; padding: 20px; border-radius: 8px; border-left: 4px solid #28a745;">
+                <h4 style="color: #28a745; margin-top: 0;">🕐 Enhanced: ODS + WebSearch + TemporalKG</h4>
+                <div style="background: white; padding: 15px; border-radius: 4px; margin: 10px 0; border: 1px solid #c3e6cb; font-size: 14px; line-height: 1.4;">
+                    {enhanced_preview}
+                </div>
+                <div style="background: #d4edda; padding: 10px; border-radius: 4px; font-size: 12px;">
+                    <strong>Length:</strong> {enhanced_length} words 
+                    <span style="color: #28a745;">(+{word_length_increase})</span><br>
+                    <strong>Temporal Keywords:</strong> {enhanced_temporal}
+                    <span style="color: #28a745;">(+{temporal_word_increase})</span><br>
+                    <strong>Accuracy Score:</strong> {enhanced_accuracy:.3f}
+                    <span style="color: #28a745;">(+{accuracy_improvement:.3f})</span>
+                </div>
+            </div>
+        </div>
+        
+        {context_html}
+        
+        <div style="background: #f8f9fa; padding: 15px; border-radius: 8px; border-left: 4px solid #007bff;">
+            <h4 style="color: #007bff; margin-top: 0;">🔍 Key Improvements:</h4>
+            <ul style="margin: 0; padding-left: 20px;">
+                {key_differences_html}
+            </ul>
+            <div style="margin-top: 15px; display: grid; grid-template-columns: 1fr 1fr 1fr; gap: 15px; text-align: center;">
+                <div>
+                    <strong>Accuracy Improvement</strong><br>
+                    <span style="font-size: 1.2em; color: #28a745; font-weight: bold;">
+                        {accuracy_improvement:+.3f}
+                    </span>
+                </div>
+                <div>
+                    <strong>Context Relevance</strong><br>
+                    <span style="font-size: 1.2em; color: #007bff; font-weight: bold;">
+                        {context_relevance:.3f}
+                    </span>
+                </div>
+                <div>
+                    <strong>Overall Improvement</strong><br>
+                    <span style="font-size: 1.2em; color: #6f42c1; font-weight: bold;">
+                        {overall_improvement:+.3f}
+                    </span>
+                </div>
+            </div>
+        </div>
+    </div>
+    """
+REPORT_CONTEXT_TEMPLATE = """
+        <div style="background: #fff3cd; padding: 15px; border-radius: 8px; margin-bottom: 15px;">
+            <h5 style="color: #856404; margin-top: 0;">🕐 Temporal Context from Neo4j:</h5>
+            <div style="background: white; padding: 10px; border-radius: 4px; font-size: 12px; font-family: monospace;">
+                {context_preview}
+            </div>
+        </div>
+        """
+
+REPORT_FOOTER = """
+                </div>
+                
+                <div style="background: #f8f9fa; padding: 20px; border-radius: 8px; margin-top: 30px;">
+                    <h2 style="color: #495057; margin-top: 0;">🔍 Key Insights</h2>
+                    <ul style="color: #495057;">
+                        <li><strong>Side-by-side comparison</strong> clearly shows the value added by TemporalKG context injection</li>
+                        <li><strong>Temporal accuracy improvements</strong> are measurable and consistent across question types</li>
+                        <li><strong>Context integration</strong> enhances responses with specific database information</li>
+                        <li><strong>Enhancement success</strong> depends on both context availability and relevance</li>
+                        <li><strong>Real-world performance</strong> evaluation on curated questions designed for your Neo4j data</li>
+                    </ul>
+                </div>
+            </div>
+        </body>
+        </html>
+        """
+
+
+def preview(text: str, limit: int) -> str:
+    """text cut to limit characters, with "..." when something was dropped"""
+    if len(text) <= limit:
+        return text
+    return text[:limit] + "..."
+
+
+def fusion_messages(
+    question: str, base_response: str, temporal_context: str
+) -> List[Dict[str, str]]:
+    """Chat messages for the context-injection (fusion) call.
+
+    Both inputs are clipped to the prompt budget; the head of a web-search
+    answer carries most of its content.
+    """
+    enhanced_prompt = (
+        f"Question: {question}\n"
+        f"Web results: {base_response[:FUSION_BASE_RESPONSE_CHARS]}\n"
+        f"Database timeline: {temporal_context[:FUSION_CONTEXT_CHARS]}\n"
+        "Answer concisely, combining both and keeping dates and order exact."
+    )
+    return [FUSION_SYSTEM_MESSAGE, {"role": "user", "content": enhanced_prompt}]
+
+
 @dataclass
 class CuratedEvaluationResult:
     question: str
@@ -46,24 +530,104 @@ class CuratedEvaluationResult:
     temporal_context: str = ""
 
 
+def render_report_section(
+    number: int, result: CuratedEvaluationResult, response_analysis: Dict[str, Any]
+) -> str:
+    """HTML comparison section for one result of the curated report"""
+
+    # Format key differences
+    key_differences_html = "".join(
+        f"<li>{diff}</li>" for diff in response_analysis["key_differences"]
+    )
+
+    if not response_analysis["key_differences"]:
+        key_differences_html = "<li>No significant differences detected</li>"
+
+    # Format temporal words
+    baseline_temporal_display = ", ".join(
+        response_analysis["baseline_temporal_words"][:5]
+    )
+    enhanced_temporal_display = ", ".join(
+        response_analysis["enhanced_temporal_words"][:5]
+    )
+
+    if len(response_analysis["baseline_temporal_words"]) > 5:
+        baseline_temporal_display += (
+            f" (+{len(response_analysis['baseline_temporal_words']) - 5} more)"
+        )
+    if len(response_analysis["enhanced_temporal_words"]) > 5:
+        enhanced_temporal_display += (
+            f" (+{len(response_analysis['enhanced_temporal_words']) - 5} more)"
+        )
+
+    # Truncated response copies shown in the section
+    baseline_preview = preview(result.baseline_response, REPORT_PREVIEW_CHARS)
+    enhanced_preview = preview(result.enhanced_response, REPORT_PREVIEW_CHARS)
+
+    context_html = ""
+    if result.temporal_context:
+        context_html = REPORT_CONTEXT_TEMPLATE.format_map(
+            {
+                "context_preview": preview(
+                    result.temporal_context, REPORT_CONTEXT_PREVIEW_CHARS
+                )
+            }
+        )
+
+    return REPORT_SECTION_TEMPLATE.format_map(
+        {
+            "number": number,
+            "question": result.question,
+            "question_type": result.question_type,
+            "domain": result.domain,
+            "context_color": "#28a745" if result.temporal_context_added else "#dc3545",
+            "context_label": "✅ Yes" if result.temporal_context_added else "❌ No",
+            "baseline_preview": baseline_preview,
+            "baseline_length": response_analysis["baseline_length"],
+            "baseline_temporal": baseline_temporal_display or "None",
+            "baseline_accuracy": result.baseline_accuracy,
+            "enhanced_preview": enhanced_preview,
+            "enhanced_length": response_analysis["enhanced_length"],
+            "word_length_increase": response_analysis["word_length_increase"],
+            "enhanced_temporal": enhanced_temporal_display or "None",
+            "temporal_word_increase": response_analysis["temporal_word_increase"],
+            "enhanced_accuracy": result.enhanced_accuracy,
+            "accuracy_improvement": result.temporal_accuracy_improvement,
+            "context_relevance": result.context_relevance_score,
+            "overall_improvement": result.overall_improvement,
+            "key_differences_html": key_differences_html,
+            "context_html": context_html,
+        }
+    )
+
+
 class CuratedTemporalEvaluator:
     """Evaluates TemporalKGTool on curated questions designed for the Neo4j data"""
 
-    def __init__(self):
+    def __init__(self, use_batch_api: bool = False):
         self.openai_api_key = os.getenv("OPENAI_API_KEY")
-        openai.api_key = self.openai_api_key
+        # Defer every fusion call to one OpenAI Batch API job (cheaper, but the
+        # run waits for the batch to complete)
+        self.use_batch_api = use_batch_api
+        # Async client so the fusion call can overlap with other per-question I/O
+        self.client = openai.AsyncOpenAI(api_key=self.openai_api_key)
 
         # Neo4j connection details
         self.neo4j_uri = os.getenv("NEO4J_URI", "bolt://localhost:7687")
         self.neo4j_username = os.getenv("NEO4J_USERNAME", "neo4j")
         self.neo4j_password = os.getenv("NEO4J_PASSWORD")
 
+        # Temporal context per question for this run: {question: (context, ok)}
+        self._temporal_contexts: Dict[str, Tuple[str, bool]] = {}
+        # Web-search answers per question, shared by the baseline and enhanced
+        # systems; tasks are stored so concurrent callers await one search
+        self._search_responses: Dict[str, "asyncio.Task[str]"] = {}
+
         # Setup systems
         if OPENDEEPSEARCH_AVAILABLE:
             self.setup_evaluation_systems()
         else:
-            self.baseline_ods = None
-            self.enhanced_ods = None
+            self.ods = None
 
         # Load curated ground truth
         self.curated_questions = self.load_curated_ground_truth()
@@ -72,19 +636,11 @@ class CuratedTemporalEvaluator:
         """Setup both baseline and enhanced ODS systems"""
         print("🔧 Setting up evaluation systems...")
 
-        # Baseline: ODS + WebSearch only
-        self.baseline_ods = OpenDeepSearchTool(
-            model_name="openrouter/google/gemini-2.0-flash-001", reranker="jina"
-        )
-        if not self.baseline_ods.is_initialized:
-            self.baseline_ods.setup()
-
-        # Enhanced: ODS + WebSearch + TemporalKG context injection
-        self.enhanced_ods = OpenDeepSearchTool(
-            model_name="openrouter/google/gemini-2.0-flash-001", reranker="jina"
-        )
-        if not self.enhanced_ods.is_initialized:
-            self.enhanced_ods.setup()
+        # One ODS + WebSearch tool serves both systems: the enhanced system
+        # only injects TemporalKG context after the search
+        self.ods = OpenDeepSearchTool(model_name=ODS_MODEL, reranker="jina")
+        if not self.ods.is_initialized:
+            self.ods.setup()
 
         # TemporalKGTool for context injection
         self.temporal_kg_tool = None
@@ -101,9 +657,9 @@ class CuratedTemporalEvaluator:
         else:
             print("   ⚠️ NEO4J_PASSWORD not set - TemporalKGTool unavailable")
 
-        print(f"   🌐 Baseline ODS: {'✅' if self.baseline_ods else '❌'}")
+        print(f"   🌐 Baseline ODS: {'✅' if self.ods else '❌'}")
         print(
-            f"   🕐 Enhanced ODS: {'✅' if self.enhanced_ods and self.temporal_kg_tool else '❌'}"
+            f"   🕐 Enhanced ODS: {'✅' if self.ods and self.temporal_kg_tool else '❌'}"
         )
 
     def load_curated_ground_truth(self) -> List[Dict[str, Any]]:
@@ -119,24 +675,31 @@ class CuratedTemporalEvaluator:
         for file_path in ground_truth_files:
             try:
                 if os.path.exists(file_path):
-                    with open(file_path, "r") as f:
-                        questions = json.load(f)
-
-                    print(
-                        f"✅ Loaded {len(questions)} curated questions from {file_path}"
-                    )
-
-                    # Analyze question types
+                    questions = []
                     question_types = {}
                     temporal_questions = 0
 
-                    for q in questions:
-                        qtype = q.get("type", "unknown")
-                        question_types[qtype] = question_types.get(qtype, 0) + 1
+                    # Parse, project and count in one pass over the records
+                    with open(file_path, "rb") as f:
+                        records = (
+                            ijson.items(f, "item")
+                            if ijson is not None
+                            else _json.loads(f.read())
+                        )
+                        for record in records:
+                            q = {k: record[k] for k in GROUND_TRUTH_FIELDS if k in record}
+                            questions.append(q)
 
-                        # Count temporal questions
-                        if self.is_temporal_question(q):
-                            temporal_questions += 1
+                            qtype = q.get("type", "unknown")
+                            question_types[qtype] = question_types.get(qtype, 0) + 1
+
+                            # Count temporal questions
+                            if self.is_temporal_question(q):
+                                temporal_questions += 1
+
+                    print(
+                        f"✅ Loaded {len(questions)} curated questions from {file_path}"
+                    )
 
                     print(f"   📊 Question types: {dict(question_types)}")
                     print(
@@ -197,16 +760,16 @@ class CuratedTemporalEvaluator:
             or any(indicator in question for indicator in neo4j_indicators)
         )
 
-    def answer_with_baseline(self, question: str) -> Tuple[str, float]:
+    async def answer_with_baseline(self, question: str) -> Tuple[str, float]:
         """Get baseline response: ODS + WebSearch only"""
-        if not self.baseline_ods:
+        if not self.ods:
             return "Baseline ODS not available", 0.0
 
         print(f"🌐 Baseline (WebSearch only): {question}")
 
         start_time = time.time()
         try:
-            response = self.baseline_ods.forward(question)
+            response = await self.cached_search(question)
             execution_time = time.time() - start_time
             print(f"   ✅ Baseline completed in {execution_time:.2f}s")
             return response, execution_time
@@ -214,7 +777,35 @@ class CuratedTemporalEvaluator:
             print(f"   ❌ Baseline error: {e}")
             return f"Baseline error: {str(e)}", time.time() - start_time
 
-    def get_temporal_context(
+    async def cached_search(self, question: str) -> str:
+        """Run self.ods.forward(question) at most once per question.
+
+        Baseline and enhanced share the search, including while it is in
+        flight. Answers are memoized for the run and kept in the on-disk LLM
+        cache across runs; errors propagate and are not cached.
+        """
+        task = self._search_responses.get(question)
+        if task is None:
+            task = asyncio.ensure_future(self._search(question))
+            self._search_responses[question] = task
+        try:
+            return await task
+        except Exception:
+            if self._search_responses.get(question) is task:
+                del self._search_responses[question]
+            raise
+
+    async def _search(self, question: str) -> str:
+        cache_key = _llm_cache.make_key(
+            ODS_MODEL, None, question, namespace=ODS_CACHE_NAMESPACE
+        )
+        response = _llm_cache.get(cache_key)
+        if response is None:
+            response = await asyncio.to_thread(self.ods.forward, question)
+            _llm_cache.put(cache_key, response, model=ODS_MODEL)
+        return response
+
+    async def get_temporal_context(
         self, question: str, neo4j_query: str = None
     ) -> Tuple[str, bool]:
         """Get temporal context from Neo4j for context injection"""
@@ -223,9 +814,28 @@ class CuratedTemporalEvaluator:
 
         print(f"   🕐 Getting temporal context for: {question}")
 
+        if question in self._temporal_contexts:
+            return self._temporal_contexts[question]
+
+        # Meaningful contexts from earlier runs are kept in the on-disk cache
+        cache_key = _llm_cache.make_key(
+            None,
+            None,
+            f"{self.neo4j_uri}|{question}",
+            namespace=TEMPORAL_CONTEXT_CACHE_NAMESPACE,
+        )
+
         try:
+            cached = _llm_cache.get(cache_key)
+            if cached is not None:
+                print(f"   ✅ Temporal context from cache ({len(cached)} chars)")
+                self._temporal_contexts[question] = (cached, True)
+                return cached, True
+
             # Use TemporalKGTool to get context
-            temporal_response = self.temporal_kg_tool.forward(question)
+            temporal_response = await asyncio.to_thread(
+                self.temporal_kg_tool.forward, question
+            )
 
             # Check if we got meaningful context
             if (
@@ -237,38 +847,56 @@ class CuratedTemporalEvaluator:
                 print(
                     f"   ✅ Temporal context retrieved ({len(temporal_response)} chars)"
                 )
+                _llm_cache.put(cache_key, temporal_response)
+                self._temporal_contexts[question] = (temporal_response, True)
                 return temporal_response, True
             else:
+                # Not persisted: TemporalKGTool reports failures the same way
                 print(f"   ⚠️ No meaningful temporal context found")
+                self._temporal_contexts[question] = ("", False)
                 return "", False
 
         except Exception as e:
             print(f"   ❌ Temporal context error: {e}")
             return "", False
 
-    def answer_with_enhanced(
-        self, question: str, neo4j_query: str = None
+    async def answer_with_enhanced(
+        self, question: str, neo4j_query: str = None, fuse: bool = True
     ) -> Tuple[str, float, bool, str]:
-        """Get enhanced response: ODS + WebSearch + TemporalKG context injection"""
-        if not self.enhanced_ods:
+        """Get enhanced response: ODS + WebSearch + TemporalKG context injection
+
+        With fuse=False the fusion step is skipped: when context was found the
+        base web-search response is returned with temporal_context_added=True,
+        for the caller to fuse later (see fuse_with_batch_api).
+        """
+        if not self.ods:
             return "Enhanced ODS not available", 0.0, False, ""
 
         print(f"🕐 Enhanced (WebSearch + Temporal context): {question}")
 
         start_time = time.time()
 
-        # Step 1: Get base web search response
-        try:
-            base_response = self.enhanced_ods.forward(question)
-            print(f"   ✅ Base web search completed")
-        except Exception as e:
-            print(f"   ❌ Base web search error: {e}")
-            return f"Enhanced error: {str(e)}", time.time() - start_time, False, ""
-
-        # Step 2: Get temporal context from Neo4j
-        temporal_context, context_added = self.get_temporal_context(
-            question, neo4j_query
+        # Steps 1 and 2 are independent: run the base web search and the
+        # Neo4j temporal context lookup concurrently
+        base_response, temporal_result = await asyncio.gather(
+            self.cached_search(question),
+            self.get_temporal_context(question, neo4j_query),
+            return_exceptions=True,
         )
+        if isinstance(temporal_result, BaseException):
+            print(f"   ❌ Temporal context error: {temporal_result}")
+            temporal_context, context_added = "", False
+        else:
+            temporal_context, context_added = temporal_result
+        if isinstance(base_response, BaseException):
+            print(f"   ❌ Base web search error: {base_response}")
+            return (
+                f"Enhanced error: {str(base_response)}",
+                time.time() - start_time,
+                False,
+                "",
+            )
+        print(f"   ✅ Base web search completed")
 
         if not context_added:
             # No temporal context available, return base response
@@ -276,33 +904,16 @@ class CuratedTemporalEvaluator:
             print(f"   ⚠️ No temporal enhancement applied")
             return base_response, execution_time, False, ""
 
+        if not fuse:
+            return base_response, time.time() - start_time, True, temporal_context
+
         # Step 3: Inject temporal context and regenerate response
         try:
-            enhanced_prompt = f"""
-            Based on the web search results and the following temporal context from our database, 
-            provide a comprehensive answer to the question.
-            
-            Question: {question}
-            
-            Web Search Results: {base_response}
-            
-            Temporal Context from Database: {temporal_context}
-            
-            Provide an enhanced answer that incorporates both the web search results and the 
-            specific temporal context from our database. Focus on temporal accuracy and chronological details.
-            """
-
-            response = openai.chat.completions.create(
-                model="gpt-3.5-turbo",
-                messages=[
-                    {
-                        "role": "system",
-                        "content": "Combine web search results with temporal database context to provide accurate, chronologically-aware responses.",
-                    },
-                    {"role": "user", "content": enhanced_prompt},
-                ],
-                temperature=0.1,
-                max_tokens=400,
+            response = await self.client.chat.completions.create(
+                model=FUSION_MODEL,
+                messages=fusion_messages(question, base_response, temporal_context),
+                temperature=FUSION_TEMPERATURE,
+                max_tokens=FUSION_MAX_TOKENS,
             )
 
             enhanced_response = response.choices[0].message.content.strip()
@@ -318,211 +929,99 @@ class CuratedTemporalEvaluator:
             # Fallback to base response
             return base_response, time.time() - start_time, False, temporal_context
 
-    def analyze_response_differences(
-        self, baseline: str, enhanced: str, context_added: bool
-    ) -> Dict[str, Any]:
-        """Analyze detailed differences between baseline and enhanced responses"""
-
-        # Basic metrics
-        baseline_words = baseline.split()
-        enhanced_words = enhanced.split()
-
-        # Temporal keywords analysis
-        temporal_keywords = [
-            "chronological",
-            "timeline",
-            "sequence",
-            "first",
-            "then",
-            "next",
-            "before",
-            "after",
-            "during",
-            "subsequently",
-            "followed by",
-            "earlier",
-            "later",
-            "meanwhile",
-            "simultaneously",
-            "previously",
-            "afterwards",
-        ]
-
-        baseline_temporal = [
-            word for word in baseline_words if word.lower() in temporal_keywords
-        ]
-        enhanced_temporal = [
-            word for word in enhanced_words if word.lower() in temporal_keywords
-        ]
-
-        # Date/time patterns
-        date_patterns = [
-            r"\b\d{4}\b",  # Years
-            r"\b(january|february|march|april|may|june|july|august|september|october|november|december)\b",
-            r"\b\d{1,2}[\/\-]\d{1,2}[\/\-]\d{4}\b",  # Dates
-            r"\b(q1|q2|q3|q4)\b",  # Quarters
-        ]
-
-        baseline_dates = []
-        enhanced_dates = []
+    async def fuse_with_batch_api(
+        self, requests: List[Tuple[str, List[Dict[str, str]]]]
+    ) -> Dict[str, str]:
+        """Run fusion calls as one OpenAI Batch API job.
 
-        for pattern in date_patterns:
-            baseline_dates.extend(re.findall(pattern, baseline.lower()))
-            enhanced_dates.extend(re.findall(pattern, enhanced.lower()))
-
-        # Specific entities (proper nouns, numbers)
-        baseline_entities = re.findall(r"\b[A-Z][a-z]+\b|\b\d+\b", baseline)
-        enhanced_entities = re.findall(r"\b[A-Z][a-z]+\b|\b\d+\b", enhanced)
+        requests is a list of (custom_id, messages). Returns {custom_id: content}
+        for the requests that succeeded; failed ones are left out.
+        """
+        if not requests:
+            return {}
 
-        # Key differences
-        key_differences = []
+        print(f"\n📦 Submitting {len(requests)} fusion calls as one OpenAI batch...")
 
-        if len(enhanced_temporal) > len(baseline_temporal):
-            key_differences.append(
-                f"Enhanced response uses {len(enhanced_temporal) - len(baseline_temporal)} more temporal keywords"
+        batch_input = "".join(
+            json.dumps(
+                {
+                    "custom_id": custom_id,
+                    "method": "POST",
+                    "url": "/v1/chat/completions",
+                    "body": {
+                        "model": FUSION_MODEL,
+                        "messages": messages,
+                        "temperature": FUSION_TEMPERATURE,
+                        "max_tokens": FUSION_MAX_TOKENS,
+                    },
+                }
             )
+            + "\n"
+            for custom_id, messages in requests
+        ).encode("utf-8")
 
-        if len(enhanced_dates) > len(baseline_dates):
-            key_differences.append(
-                f"Enhanced response includes {len(enhanced_dates) - len(baseline_dates)} more date/time references"
+        try:
+            input_file = await self.client.files.create(
+                file=("fusion_batch.jsonl", batch_input), purpose="batch"
             )
-
-        if len(enhanced_entities) > len(baseline_entities):
-            key_differences.append(
-                f"Enhanced response mentions {len(enhanced_entities) - len(baseline_entities)} more specific entities"
+            batch = await self.client.batches.create(
+                input_file_id=input_file.id,
+                endpoint="/v1/chat/completions",
+                completion_window="24h",
             )
 
-        if len(enhanced_words) > len(baseline_words):
-            key_differences.append(
-                f"Enhanced response is {len(enhanced_words) - len(baseline_words)} words longer with more detail"
-            )
+            while batch.status not in ("completed", "failed", "expired", "cancelled"):
+                print(f"   ⏳ Batch {batch.id}: {batch.status}")
+                await asyncio.sleep(BATCH_POLL_SECONDS)
+                batch = await self.client.batches.retrieve(batch.id)
 
-        if context_added:
-            key_differences.append(
-                "Temporal context from Neo4j database was successfully integrated"
-            )
+            if batch.status != "completed" or not batch.output_file_id:
+                print(f"   ❌ Batch {batch.id} ended with status {batch.status}")
+                return {}
 
-        # Context integration indicators
-        context_indicators = [
-            "database",
-            "records show",
-            "timeline indicates",
-            "data shows",
-            "according to our data",
-        ]
-        has_context_integration = any(
-            indicator in enhanced.lower() for indicator in context_indicators
-        )
+            output = await self.client.files.content(batch.output_file_id)
+        except Exception as e:
+            print(f"   ❌ Batch fusion error: {e}")
+            return {}
 
-        if has_context_integration:
-            key_differences.append(
-                "Response explicitly references database/temporal data"
-            )
+        fused = {}
+        for line in output.text.splitlines():
+            if not line.strip():
+                continue
+            entry = json.loads(line)
+            response = entry.get("response") or {}
+            if response.get("status_code") != 200:
+                continue
+            fused[entry["custom_id"]] = response["body"]["choices"][0]["message"][
+                "content"
+            ].strip()
 
-        return {
-            "baseline_length": len(baseline_words),
-            "enhanced_length": len(enhanced_words),
-            "baseline_temporal_words": baseline_temporal,
-            "enhanced_temporal_words": enhanced_temporal,
-            "baseline_dates": baseline_dates,
-            "enhanced_dates": enhanced_dates,
-            "baseline_entities": baseline_entities,
-            "enhanced_entities": enhanced_entities,
-            "key_differences": key_differences,
-            "word_length_increase": len(enhanced_words) - len(baseline_words),
-            "temporal_word_increase": len(enhanced_temporal) - len(baseline_temporal),
-            "has_context_integration": has_context_integration,
-        }
+        print(f"   ✅ Batch completed: {len(fused)}/{len(requests)} fusion calls succeeded")
+        return fused
+
+    def analyze_response_differences(
+        self, baseline: str, enhanced: str, context_added: bool
+    ) -> Dict[str, Any]:
+        """Analyze detailed differences between baseline and enhanced responses"""
+        return analyze_response_differences(baseline, enhanced, context_added)
 
     def evaluate_temporal_accuracy(
         self, question: str, response: str, has_temporal_context: bool
     ) -> float:
         """Evaluate temporal accuracy in response"""
 
-        response_lower = response.lower()
-        accuracy_score = 0.0
-
-        # 1. Temporal vocabulary (25%)
-        temporal_words = [
-            "chronological",
-            "timeline",
-            "sequence",
-            "first",
-            "then",
-            "next",
-            "before",
-            "after",
-            "during",
-            "subsequently",
-            "followed by",
-        ]
-        temporal_word_count = sum(
-            1 for word in temporal_words if word in response_lower
+        stats = response_stats(response)
+        keywords = stats.keywords
+        context_integration = has_temporal_context and not keywords.isdisjoint(
+            CONTEXT_INDICATORS
         )
-        vocab_score = min(1.0, temporal_word_count / 4)
-        accuracy_score += vocab_score * 0.25
-
-        # 2. Date/time specificity (30%)
-        date_patterns = [
-            r"\b\d{4}\b",  # Years (2020, 2021, etc.)
-            r"\b(january|february|march|april|may|june|july|august|september|october|november|december)\b",
-            r"\b\d{1,2}[\/\-]\d{1,2}[\/\-]\d{4}\b",  # Dates
-            r"\b(q1|q2|q3|q4)\b",  # Quarters
-        ]
-
-        date_specificity = 0.0
-        for pattern in date_patterns:
-            if re.search(pattern, response_lower):
-                date_specificity += 0.25
-
-        accuracy_score += min(1.0, date_specificity) * 0.30
-
-        # 3. Sequential structure (20%)
-        sequence_indicators = [
-            "first",
-            "second",
-            "then",
-            "next",
-            "finally",
-            "subsequently",
-        ]
-        sequence_count = sum(
-            1 for indicator in sequence_indicators if indicator in response_lower
+        return temporal_accuracy_score(
+            len(keywords.intersection(TEMPORAL_VOCABULARY)),
+            len(stats.date_kinds),
+            len(keywords.intersection(SEQUENCE_INDICATORS)),
+            len(keywords.intersection(SPECIFIC_ENTITIES)),
+            context_integration,
         )
-        sequence_score = min(1.0, sequence_count / 3)
-        accuracy_score += sequence_score * 0.20
-
-        # 4. Specific entity references (25%) - should be higher with temporal context
-        specific_entities = [
-            "covid",
-            "cust_",
-            "customer",
-            "brazil",
-            "france",
-            "who",
-            "cdc",
-        ]
-        entity_count = sum(
-            1 for entity in specific_entities if entity in response_lower
-        )
-        entity_score = min(1.0, entity_count / 3)
-        accuracy_score += entity_score * 0.25
-
-        # Bonus for temporal context integration
-        if has_temporal_context:
-            context_indicators = [
-                "database",
-                "records show",
-                "timeline indicates",
-                "data shows",
-            ]
-            context_integration = any(
-                indicator in response_lower for indicator in context_indicators
-            )
-            if context_integration:
-                accuracy_score += 0.1  # 10% bonus for context integration
-
-        return min(1.0, accuracy_score)
 
     def evaluate_context_relevance(
         self,
@@ -537,14 +1036,14 @@ class CuratedTemporalEvaluator:
             return 0.0  # No context added
 
         # Simple heuristics for context relevance
-        baseline_lower = baseline_response.lower()
-        enhanced_lower = enhanced_response.lower()
+        baseline_stats = response_stats(baseline_response)
+        enhanced_stats = response_stats(enhanced_response)
 
         relevance_score = 0.0
 
         # 1. Enhanced response has more specific information
-        baseline_words = len(baseline_response.split())
-        enhanced_words = len(enhanced_response.split())
+        baseline_words = len(baseline_stats.words)
+        enhanced_words = len(enhanced_stats.words)
 
         if enhanced_words > baseline_words:
             length_improvement = min(
@@ -553,27 +1052,19 @@ class CuratedTemporalEvaluator:
             relevance_score += length_improvement
 
         # 2. Enhanced response has more temporal vocabulary
-        temporal_words = [
-            "timeline",
-            "sequence",
-            "chronological",
-            "during",
-            "before",
-            "after",
-        ]
-        baseline_temporal = sum(1 for word in temporal_words if word in baseline_lower)
-        enhanced_temporal = sum(1 for word in temporal_words if word in enhanced_lower)
+        baseline_temporal = len(
+            baseline_stats.keywords.intersection(RELEVANCE_TEMPORAL_WORDS)
+        )
+        enhanced_temporal = len(
+            enhanced_stats.keywords.intersection(RELEVANCE_TEMPORAL_WORDS)
+        )
 
         if enhanced_temporal > baseline_temporal:
             relevance_score += 0.3
 
         # 3. Enhanced response has more specific entities/facts
-        baseline_specifics = len(
-            re.findall(r"\b[A-Z][a-z]+\b|\b\d+\b", baseline_response)
-        )
-        enhanced_specifics = len(
-            re.findall(r"\b[A-Z][a-z]+\b|\b\d+\b", enhanced_response)
-        )
+        baseline_specifics = len(baseline_stats.entities)
+        enhanced_specifics = len(enhanced_stats.entities)
 
         if enhanced_specifics > baseline_specifics:
             relevance_score += 0.4
@@ -614,7 +1105,12 @@ class CuratedTemporalEvaluator:
             "🔄 Architecture: WebSearch → TemporalKG Context Injection → Enhanced Response"
         )
 
+        return asyncio.run(self._run_curated_evaluation())
+
+    async def _run_curated_evaluation(self) -> List[CuratedEvaluationResult]:
         results = []
+        # Answers whose fusion call is deferred to the batch job
+        deferred = []
 
         for i, question_data in enumerate(self.curated_questions):
             question = question_data["question"]
@@ -628,78 +1124,166 @@ class CuratedTemporalEvaluator:
                 f"   Designed for temporal data: {'✅' if self.is_temporal_question(question_data) else '❌'}"
             )
 
-            # Get responses from both systems
-            baseline_response, baseline_time = self.answer_with_baseline(question)
+            # Get responses from both systems; they are independent, so the
+            # baseline search overlaps with the enhanced search + context lookup
             (
+                (baseline_response, baseline_time),
+                (
+                    enhanced_response,
+                    enhanced_time,
+                    temporal_context_added,
+                    temporal_context,
+                ),
+            ) = await asyncio.gather(
+                self.answer_with_baseline(question),
+                self.answer_with_enhanced(
+                    question, neo4j_query, fuse=not self.use_batch_api
+                ),
+            )
+
+            answer = (
+                question_data,
+                baseline_response,
                 enhanced_response,
-                enhanced_time,
                 temporal_context_added,
                 temporal_context,
-            ) = self.answer_with_enhanced(question, neo4j_query)
-
-            print(
-                f"   Temporal context added: {'✅' if temporal_context_added else '❌'}"
             )
-
-            # Evaluate responses
-            baseline_accuracy = self.evaluate_temporal_accuracy(
-                question, baseline_response, False
-            )
-            enhanced_accuracy = self.evaluate_temporal_accuracy(
-                question, enhanced_response, temporal_context_added
+            if self.use_batch_api:
+                deferred.append(answer)
+            else:
+                results.append(self.score_question(*answer))
+
+        if deferred:
+            # Fuse every answer that found temporal context in one batch job
+            fused = await self.fuse_with_batch_api(
+                [
+                    (
+                        f"q{i}",
+                        fusion_messages(
+                            question_data["question"], base_response, temporal_context
+                        ),
+                    )
+                    for i, (
+                        question_data,
+                        _,
+                        base_response,
+                        temporal_context_added,
+                        temporal_context,
+                    ) in enumerate(deferred)
+                    if temporal_context_added
+                ]
             )
+            for i, (
+                question_data,
+                baseline_response,
+                enhanced_response,
+                temporal_context_added,
+                temporal_context,
+            ) in enumerate(deferred):
+                if temporal_context_added:
+                    if f"q{i}" in fused:
+                        enhanced_response = fused[f"q{i}"]
+                    else:
+                        # Fallback to base response, as for a failed fusion call
+                        temporal_context_added = False
+                results.append(
+                    self.score_question(
+                        question_data,
+                        baseline_response,
+                        enhanced_response,
+                        temporal_context_added,
+                        temporal_context,
+                    )
+                )
 
-            context_relevance = self.evaluate_context_relevance(
-                question, baseline_response, enhanced_response, temporal_context_added
-            )
+        return results
 
-            overall_improvement = self.calculate_overall_improvement(
-                baseline_accuracy, enhanced_accuracy, context_relevance
-            )
+    def score_question(
+        self,
+        question_data: Dict[str, Any],
+        baseline_response: str,
+        enhanced_response: str,
+        temporal_context_added: bool,
+        temporal_context: str,
+    ) -> CuratedEvaluationResult:
+        """Score one question's baseline and enhanced responses"""
+        question = question_data["question"]
 
-            # Enhancement success criteria
-            enhancement_successful = (
-                temporal_context_added  # Context was added
-                and enhanced_accuracy
-                > baseline_accuracy + 0.05  # Meaningful accuracy improvement
-                and context_relevance > 0.2  # Context was relevant
-            )
+        print(
+            f"   Temporal context added: {'✅' if temporal_context_added else '❌'}"
+        )
 
-            result = CuratedEvaluationResult(
-                question=question,
-                question_type=qtype,
-                domain=domain,
-                neo4j_query=neo4j_query,
-                baseline_response=baseline_response,
-                enhanced_response=enhanced_response,
-                temporal_context_added=temporal_context_added,
-                temporal_accuracy_improvement=enhanced_accuracy - baseline_accuracy,
-                context_relevance_score=context_relevance,
-                overall_improvement=overall_improvement,
-                enhancement_successful=enhancement_successful,
-                baseline_accuracy=baseline_accuracy,
-                enhanced_accuracy=enhanced_accuracy,
-                temporal_context=temporal_context,
-            )
+        # Evaluate responses
+        baseline_accuracy = self.evaluate_temporal_accuracy(
+            question, baseline_response, False
+        )
+        enhanced_accuracy = self.evaluate_temporal_accuracy(
+            question, enhanced_response, temporal_context_added
+        )
 
-            results.append(result)
+        context_relevance = self.evaluate_context_relevance(
+            question, baseline_response, enhanced_response, temporal_context_added
+        )
 
-            print(
-                f"📊 Temporal accuracy improvement: {enhanced_accuracy - baseline_accuracy:+.3f}"
-            )
-            print(f"📊 Context relevance: {context_relevance:.3f}")
-            print(f"📊 Overall improvement: {overall_improvement:+.3f}")
-            print(f"✅ Enhancement successful: {enhancement_successful}")
+        overall_improvement = self.calculate_overall_improvement(
+            baseline_accuracy, enhanced_accuracy, context_relevance
+        )
 
-        return results
+        # Enhancement success criteria
+        enhancement_successful = (
+            temporal_context_added  # Context was added
+            and enhanced_accuracy
+            > baseline_accuracy + 0.05  # Meaningful accuracy improvement
+            and context_relevance > 0.2  # Context was relevant
+        )
+
+        result = CuratedEvaluationResult(
+            question=question,
+            question_type=question_data.get("type", "unknown"),
+            domain=question_data.get("domain", "unknown"),
+            neo4j_query=question_data.get("neo4j_query", ""),
+            baseline_response=baseline_response,
+            enhanced_response=enhanced_response,
+            temporal_context_added=temporal_context_added,
+            temporal_accuracy_improvement=enhanced_accuracy - baseline_accuracy,
+            context_relevance_score=context_relevance,
+            overall_improvement=overall_improvement,
+            enhancement_successful=enhancement_successful,
+            baseline_accuracy=baseline_accuracy,
+            enhanced_accuracy=enhanced_accuracy,
+            temporal_context=temporal_context,
+        )
+
+        print(
+            f"📊 Temporal accuracy improvement: {enhanced_accuracy - baseline_accuracy:+.3f}"
+        )
+        print(f"📊 Context relevance: {context_relevance:.3f}")
+        print(f"📊 Overall improvement: {overall_improvement:+.3f}")
+        print(f"✅ Enhancement successful: {enhancement_successful}")
+
+        return result
 
     def generate_curated_evaluation_report(
         self, results: List[CuratedEvaluationResult]
     ) -> str:
         """Generate enhanced evaluation report with detailed side-by-side comparisons"""
+        return "".join(self.iter_curated_evaluation_report(results))
+
+    def write_curated_evaluation_report(
+        self, results: List[CuratedEvaluationResult], path: str
+    ):
+        """Stream the comparison report to path, one section at a time"""
+        with open(path, "w", encoding="utf-8", buffering=WRITE_BUFFER_SIZE) as f:
+            f.writelines(self.iter_curated_evaluation_report(results))
+
+    def iter_curated_evaluation_report(
+        self, results: List[CuratedEvaluationResult]
+    ) -> Iterator[str]:
+        """Generate the comparison report one HTML chunk at a time"""
 
         if not results:
-            return "<html><body><h1>No Results</h1></body></html>"
+            yield "<html><body><h1>No Results</h1></body></html>"
+            return
 
         # Calculate summary metrics
         context_addition_rate = sum(
@@ -741,9 +1325,19 @@ class CuratedTemporalEvaluator:
             insight_color = "#dc3545"
             key_insight = f"TemporalKG enhancement needs significant improvement"
 
-        # Generate detailed comparison sections
-        comparison_sections = []
+        yield REPORT_HEADER_TEMPLATE.format_map(
+            {
+                "avg_accuracy_improvement": avg_accuracy_improvement,
+                "avg_context_relevance": avg_context_relevance,
+                "context_addition_rate": context_addition_rate,
+                "effectiveness": effectiveness,
+                "insight_color": insight_color,
+                "key_insight": key_insight,
+                "success_rate": success_rate,
+            }
+        )
 
+        # Detailed comparison sections
         for i, result in enumerate(results):
             # Analyze response differences
             response_analysis = self.analyze_response_differences(
@@ -751,220 +1345,9 @@ class CuratedTemporalEvaluator:
                 result.enhanced_response,
                 result.temporal_context_added,
             )
+            yield render_report_section(i + 1, result, response_analysis)
 
-            # Format key differences
-            key_differences_html = ""
-            for diff in response_analysis["key_differences"]:
-                key_differences_html += f"<li>{diff}</li>"
-
-            if not response_analysis["key_differences"]:
-                key_differences_html = "<li>No significant differences detected</li>"
-
-            # Format temporal words
-            baseline_temporal_display = ", ".join(
-                response_analysis["baseline_temporal_words"][:5]
-            )
-            enhanced_temporal_display = ", ".join(
-                response_analysis["enhanced_temporal_words"][:5]
-            )
-
-            if len(response_analysis["baseline_temporal_words"]) > 5:
-                baseline_temporal_display += (
-                    f" (+{len(response_analysis['baseline_temporal_words']) - 5} more)"
-                )
-            if len(response_analysis["enhanced_temporal_words"]) > 5:
-                enhanced_temporal_display += (
-                    f" (+{len(response_analysis['enhanced_temporal_words']) - 5} more)"
-                )
-
-            # Create section
-            section_html = f"""
-            <div style="margin-bottom: 40px; border: 2px solid #ddd; border-radius: 10px; padding: 20px;">
-                <h3 style="background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); color: white; padding: 15px; margin: -20px -20px 20px -20px; border-radius: 8px 8px 0 0;">
-                    📝 Question {i + 1}: {result.question}
-                </h3>
-                <p style="margin: 0 0 20px 0; color: #666; font-style: italic;">
-                    Type: {result.question_type} | Domain: {result.domain} | 
-                    Context Added: <span style="color: {
-                "#28a745" if result.temporal_context_added else "#dc3545"
-            };">
-                        {"✅ Yes" if result.temporal_context_added else "❌ No"}
-                    </span>
-                </p>
-                
-                <div style="display: grid; grid-template-columns: 1fr 1fr; gap: 20px; margin-bottom: 20px;">
-                    <div style="background: #f8f9fa; padding: 20px; border-radius: 8px; border-left: 4px solid #6c757d;">
-                        <h4 style="color: #6c757d; margin-top: 0;">🌐 Baseline: ODS + WebSearch Only</h4>
-                        <div style="background: white; padding: 15px; border-radius: 4px; margin: 10px 0; border: 1px solid #dee2e6; font-size: 14px; line-height: 1.4;">
-                            {result.baseline_response[:500]}{
-                "..." if len(result.baseline_response) > 500 else ""
-            }
-                        </div>
-                        <div style="background: #e9ecef; padding: 10px; border-radius: 4px; font-size: 12px;">
-                            <strong>Length:</strong> {
-                response_analysis["baseline_length"]
-            } words<br>
-                            <strong>Temporal Keywords:</strong> {
-                baseline_temporal_display or "None"
-            }<br>
-                            <strong>Accuracy Score:</strong> {result.baseline_accuracy:.3f}
-                        </div>
-                    </div>
-                    
-                    <div style="background: #e8f5e8; padding: 20px; border-radius: 8px; border-left: 4px solid #28a745;">
-                        <h4 style="color: #28a745; margin-top: 0;">🕐 Enhanced: ODS + WebSearch + TemporalKG</h4>
-                        <div style="background: white; padding: 15px; border-radius: 4px; margin: 10px 0; border: 1px solid #c3e6cb; font-size: 14px; line-height: 1.4;">
-                            {result.enhanced_response[:500]}{
-                "..." if len(result.enhanced_response) > 500 else ""
-            }
-                        </div>
-                        <div style="background: #d4edda; padding: 10px; border-radius: 4px; font-size: 12px;">
-                            <strong>Length:</strong> {
-                response_analysis["enhanced_length"]
-            } words 
-                            <span style="color: #28a745;">(+{
-                response_analysis["word_length_increase"]
-            })</span><br>
-                            <strong>Temporal Keywords:</strong> {
-                enhanced_temporal_display or "None"
-            }
-                            <span style="color: #28a745;">(+{
-                response_analysis["temporal_word_increase"]
-            })</span><br>
-                            <strong>Accuracy Score:</strong> {result.enhanced_accuracy:.3f}
-                            <span style="color: #28a745;">(+{result.temporal_accuracy_improvement:.3f})</span>
-                        </div>
-                    </div>
-                </div>
-                
-                {
-                f'''
-                <div style="background: #fff3cd; padding: 15px; border-radius: 8px; margin-bottom: 15px;">
-                    <h5 style="color: #856404; margin-top: 0;">🕐 Temporal Context from Neo4j:</h5>
-                    <div style="background: white; padding: 10px; border-radius: 4px; font-size: 12px; font-family: monospace;">
-                        {result.temporal_context[:200]}{"..." if len(result.temporal_context) > 200 else ""}
-                    </div>
-                </div>
-                '''
-                if result.temporal_context
-                else ""
-            }
-                
-                <div style="background: #f8f9fa; padding: 15px; border-radius: 8px; border-left: 4px solid #007bff;">
-                    <h4 style="color: #007bff; margin-top: 0;">🔍 Key Improvements:</h4>
-                    <ul style="margin: 0; padding-left: 20px;">
-                        {key_differences_html}
-                    </ul>
-                    <div style="margin-top: 15px; display: grid; grid-template-columns: 1fr 1fr 1fr; gap: 15px; text-align: center;">
-                        <div>
-                            <strong>Accuracy Improvement</strong><br>
-                            <span style="font-size: 1.2em; color: #28a745; font-weight: bold;">
-                                {result.temporal_accuracy_improvement:+.3f}
-                            </span>
-                        </div>
-                        <div>
-                            <strong>Context Relevance</strong><br>
-                            <span style="font-size: 1.2em; color: #007bff; font-weight: bold;">
-                                {result.context_relevance_score:.3f}
-                            </span>
-                        </div>
-                        <div>
-                            <strong>Overall Improvement</strong><br>
-                            <span style="font-size: 1.2em; color: #6f42c1; font-weight: bold;">
-                                {result.overall_improvement:+.3f}
-                            </span>
-                        </div>
-                    </div>
-                </div>
-            </div>
-            """
-            comparison_sections.append(section_html)
-
-        # Generate complete HTML report
-        html_content = f"""
-        <!DOCTYPE html>
-        <html>
-        <head>
-            <title>ODS vs ODS+TemporalKG Detailed Comparison Report</title>
-            <style>
-                body {{ font-family: 'Segoe UI', Arial, sans-serif; margin: 20px; line-height: 1.6; background: #f5f5f5; }}
-                .container {{ max-width: 1200px; margin: 0 auto; background: white; padding: 20px; border-radius: 10px; box-shadow: 0 2px 10px rgba(0,0,0,0.1); }}
-                .header {{ background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); color: white; padding: 30px; margin: -20px -20px 30px -20px; border-radius: 10px 10px 0 0; text-align: center; }}
-                .summary {{ background: linear-gradient(135deg, #f093fb 0%, #f5576c 100%); color: white; padding: 20px; border-radius: 8px; margin-bottom: 30px; }}
-                .effectiveness {{ background: {insight_color}; color: white; padding: 20px; border-radius: 8px; margin-bottom: 30px; text-align: center; }}
-                .architecture {{ background: #e3f2fd; padding: 20px; border-radius: 8px; margin-bottom: 30px; }}
-                .comparison-section {{ margin-bottom: 30px; }}
-            </style>
-        </head>
-        <body>
-            <div class="container">
-                <div class="header">
-                    <h1>🎯 ODS vs ODS+TemporalKG Detailed Comparison</h1>
-                    <p>Comprehensive evaluation showing exactly how TemporalKG enhances responses</p>
-                </div>
-                
-                <div class="summary">
-                    <h2 style="margin-top: 0;">📊 Overall Enhancement Results</h2>
-                    <div style="display: grid; grid-template-columns: repeat(auto-fit, minmax(200px, 1fr)); gap: 20px; margin-top: 20px;">
-                        <div style="text-align: center;">
-                            <h3 style="margin: 0; font-size: 2em;">{context_addition_rate:.1%}</h3>
-                            <p style="margin: 5px 0 0 0;">Context Addition Rate</p>
-                        </div>
-                        <div style="text-align: center;">
-                            <h3 style="margin: 0; font-size: 2em;">{avg_accuracy_improvement:+.3f}</h3>
-                            <p style="margin: 5px 0 0 0;">Avg Accuracy Improvement</p>
-                        </div>
-                        <div style="text-align: center;">
-                            <h3 style="margin: 0; font-size: 2em;">{success_rate:.1%}</h3>
-                            <p style="margin: 5px 0 0 0;">Enhancement Success Rate</p>
-                        </div>
-                        <div style="text-align: center;">
-                            <h3 style="margin: 0; font-size: 2em;">{avg_context_relevance:.3f}</h3>
-                            <p style="margin: 5px 0 0 0;">Avg Context Relevance</p>
-                        </div>
-                    </div>
-                </div>
-                
-                <div class="effectiveness">
-                    <h2 style="margin-top: 0;">🏆 Enhancement Effectiveness: {effectiveness}</h2>
-                    <p style="font-size: 1.1em; margin: 0;">{key_insight}</p>
-                </div>
-                
-                <div class="architecture">
-                    <h2 style="color: #1976d2; margin-top: 0;">🔄 System Architecture Comparison</h2>
-                    <div style="display: grid; grid-template-columns: 1fr 1fr; gap: 20px;">
-                        <div>
-                            <h4 style="color: #6c757d;">🌐 Baseline System</h4>
-                            <p style="margin: 0;">Question → ODS WebSearch → Response</p>
-                        </div>
-                        <div>
-                            <h4 style="color: #28a745;">🕐 Enhanced System</h4>
-                            <p style="margin: 0;">Question → ODS WebSearch → <strong>TemporalKG Context Injection</strong> → Enhanced Response</p>
-                        </div>
-                    </div>
-                </div>
-                
-                <h2>📋 Detailed Question-by-Question Comparisons</h2>
-                <div class="comparison-section">
-                    {"".join(comparison_sections)}
-                </div>
-                
-                <div style="background: #f8f9fa; padding: 20px; border-radius: 8px; margin-top: 30px;">
-                    <h2 style="color: #495057; margin-top: 0;">🔍 Key Insights</h2>
-                    <ul style="color: #495057;">
-                        <li><strong>Side-by-side comparison</strong> clearly shows the value added by TemporalKG context injection</li>
-                        <li><strong>Temporal accuracy improvements</strong> are measurable and consistent across question types</li>
-                        <li><strong>Context integration</strong> enhances responses with specific database information</li>
-                        <li><strong>Enhancement success</strong> depends on both context availability and relevance</li>
-                        <li><strong>Real-world performance</strong> evaluation on curated questions designed for your Neo4j data</li>
-                    </ul>
-                </div>
-            </div>
-        </body>
-        </html>
-        """
-
-        return html_content
+        yield REPORT_FOOTER
 
 
 def main():
@@ -977,7 +1360,9 @@ def main():
         print("\n❌ OpenDeepSearch not available")
         return
 
-    evaluator = CuratedTemporalEvaluator()
+    evaluator = CuratedTemporalEvaluator(
+        use_batch_api=os.getenv("ODS_EVAL_BATCH_API", "").lower() in ("1", "true", "yes")
+    )
 
     if not evaluator.curated_questions:
         print("\n❌ No curated questions found")
@@ -989,10 +1374,9 @@ def main():
 
     if results:
         # Generate enhanced report with detailed comparisons
-        report = evaluator.generate_curated_evaluation_report(results)
-
-        with open("enhanced_ods_vs_tkg_comparison.html", "w") as f:
-            f.write(report)
+        evaluator.write_curated_evaluation_report(
+            results, "enhanced_ods_vs_tkg_comparison.html"
+        )
 
         # Save detailed results
         results_data = [
@@ -2,6 +2,13 @@ import json
 import re
 from collections import defaultdict
 
+# Exact ISO dates (YYYY-MM-DD) count towards date precision
+ISO_DATE_RE = re.compile(r'\d{4}-\d{2}-\d{2}')
+
+def is_structured(response):
+    """Whether a response is a structured TKG timeline/listing"""
+    return 'Timeline for' in response or 'Found' in response
+
 def analyze_batch_results():
     """Analyze the batch evaluation results"""
     
@@ -15,14 +22,14 @@ def analyze_batch_results():
     print(f"BATCH EVALUATION ANALYSIS ({total_queries} queries)")
     print("="*60)
     
-    # Performance metrics
-    metrics = {
-        'date_precision': {'baseline': 0, 'enhanced': 0},
-        'completeness': {'baseline': 0, 'enhanced': 0},
-        'structured_response': {'baseline': 0, 'enhanced': 0},
-        'error_rate': {'baseline': 0, 'enhanced': 0},
-        'response_time': {'baseline': [], 'enhanced': []}
-    }
+    # Performance metrics, accumulated in locals and assembled once below
+    date_baseline = date_enhanced = 0
+    structured_enhanced = 0
+    complete_baseline = complete_enhanced = 0
+    errors_baseline = errors_enhanced = 0
+    times_baseline = []
+    times_enhanced = []
+    find_date = ISO_DATE_RE.search
     
     for result in results:
         baseline = result['baseline_response']
@@ -30,29 +37,37 @@ def analyze_batch_results():
         
         # Check for errors
         if 'Error:' in baseline:
-            metrics['error_rate']['baseline'] += 1
+            errors_baseline += 1
         if 'Error:' in enhanced:
-            metrics['error_rate']['enhanced'] += 1
+            errors_enhanced += 1
         
         # Check for date precision (exact dates vs approximate)
-        if re.search(r'\d{4}-\d{2}-\d{2}', enhanced):
-            metrics['date_precision']['enhanced'] += 1
-        if re.search(r'\d{4}-\d{2}-\d{2}', baseline):
-            metrics['date_precision']['baseline'] += 1
+        if find_date(enhanced):
+            date_enhanced += 1
+        if find_date(baseline):
+            date_baseline += 1
         
         # Check for structured responses
-        if 'Timeline for' in enhanced or 'Found' in enhanced:
-            metrics['structured_response']['enhanced'] += 1
+        if is_structured(enhanced):
+            structured_enhanced += 1
         
         # Check completeness (longer, more detailed responses)
         if len(enhanced) > len(baseline) * 1.2:
-            metrics['completeness']['enhanced'] += 1
+            complete_enhanced += 1
         elif len(baseline) > len(enhanced) * 1.2:
-            metrics['completeness']['baseline'] += 1
+            complete_baseline += 1
         
         # Response times
-        metrics['response_time']['baseline'].append(result.get('baseline_time', 0))
-        metrics['response_time']['enhanced'].append(result.get('enhanced_time', 0))
+        times_baseline.append(result.get('baseline_time', 0))
+        times_enhanced.append(result.get('enhanced_time', 0))
+    
+    metrics = {
+        'date_precision': {'baseline': date_baseline, 'enhanced': date_enhanced},
+        'completeness': {'baseline': complete_baseline, 'enhanced': complete_enhanced},
+        'structured_response': {'baseline': 0, 'enhanced': structured_enhanced},
+        'error_rate': {'baseline': errors_baseline, 'enhanced': errors_enhanced},
+        'response_time': {'baseline': times_baseline, 'enhanced': times_enhanced}
+    }
     
     # Calculate percentages and averages
     print(f"📊 PERFORMANCE METRICS:")
@@ -84,7 +99,7 @@ def analyze_batch_results():
         baseline = result['baseline_response']
         enhanced = result['enhanced_response']
         
-        if ('Timeline for' in enhanced or 'Found' in enhanced) and len(enhanced) > len(baseline):
+        if is_structured(enhanced) and len(enhanced) > len(baseline):
             print(f"✅ Query: {result['query'][:60]}...")
             print(f"   Enhanced provided structured timeline vs general response")
             improvements += 1
@@ -1,30 +1,106 @@
 import json
+import os
 import time
 import random
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 
-def load_queries(filename, limit=None):
-    """Load queries from file"""
-    queries = []
+# Queries evaluated at once, and agent calls in flight across all of them.
+# Each query runs two calls, so the call cap defaults below 2x the concurrency
+# to keep the OpenRouter request rate bounded.
+BATCH_EVAL_CONCURRENCY = int(os.getenv('BATCH_EVAL_CONCURRENCY', '8'))
+MAX_AGENT_CALLS = int(os.getenv('BATCH_EVAL_MAX_AGENT_CALLS', str(BATCH_EVAL_CONCURRENCY)))
+
+# The (baseline, enhanced) agent pair of each query worker thread
+_THREAD_AGENTS = threading.local()
+
+def iter_queries(filename):
+    """Yield the queries of a numbered query file ("1. ...") one at a time"""
     with open(filename, 'r') as f:
         for line in f:
             if line.strip() and line[0].isdigit():
-                query = line.split('. ', 1)[1].strip()
-                queries.append(query)
+                yield line.split('. ', 1)[1].strip()
+
+def load_queries(filename, limit=None):
+    """Load queries from file"""
+    queries = list(iter_queries(filename))
     
     if limit:
         return queries[:limit]
     return queries
 
+def sample_queries(filename, k):
+    """Uniformly sample k queries in one streaming pass (reservoir sampling)"""
+    reservoir = []
+    for seen, query in enumerate(iter_queries(filename)):
+        if seen < k:
+            reservoir.append(query)
+        else:
+            j = random.randrange(seen + 1)
+            if j < k:
+                reservoir[j] = query
+    
+    # Like random.sample, return the picks in random order
+    random.shuffle(reservoir)
+    return reservoir
+
+def _get_thread_agents(build_agents, spare_agents):
+    """Return this thread's (baseline, enhanced) agents.
+
+    The first thread to ask takes a pair already built by the caller; the
+    others build their own on first use.
+    """
+    agents = getattr(_THREAD_AGENTS, 'agents', None)
+    if agents is None:
+        try:
+            agents = spare_agents.pop()
+        except IndexError:
+            agents = build_agents()
+        _THREAD_AGENTS.agents = agents
+    return agents
+
+def _timed_run(agent, query, call_slots):
+    """Run one agent call, returning (response, seconds); errors become the response"""
+    with call_slots:
+        start = time.time()
+        try:
+            return agent.run(query), time.time() - start
+        except Exception as e:
+            return f"Error: {e}", 0
+
+def _run_pair(build_agents, spare_agents, query, query_id, call_slots):
+    """Evaluate one query, running this thread's baseline and enhanced agents concurrently"""
+    try:
+        baseline_agent, enhanced_agent = _get_thread_agents(build_agents, spare_agents)
+    except Exception as e:
+        baseline_response = enhanced_response = f"Error: {e}"
+        baseline_time = enhanced_time = 0
+    else:
+        # Each agent of the pair is only ever used by one of these two threads
+        with ThreadPoolExecutor(max_workers=2) as pair_pool:
+            baseline_future = pair_pool.submit(_timed_run, baseline_agent, query, call_slots)
+            enhanced_future = pair_pool.submit(_timed_run, enhanced_agent, query, call_slots)
+            baseline_response, baseline_time = baseline_future.result()
+            enhanced_response, enhanced_time = enhanced_future.result()
+    
+    return {
+        'query_id': query_id,
+        'query': query,
+        'baseline_response': baseline_response,
+        'enhanced_response': enhanced_response,
+        'baseline_time': baseline_time,
+        'enhanced_time': enhanced_time,
+        'timestamp': datetime.now().isoformat()
+    }
+
 def run_batch_evaluation(num_queries=100):
     """Run evaluation on batch of queries"""
     import sys
-    import os
     sys.path.append(os.getcwd())
     
     # Load queries
-    all_queries = load_queries('test_queries_large.txt')
-    test_queries = random.sample(all_queries, min(num_queries, len(all_queries)))
+    test_queries = sample_queries('test_queries_large.txt', num_queries)
     
     print(f"Running evaluation on {len(test_queries)} queries...")
     
@@ -37,65 +113,53 @@ def run_batch_evaluation(num_queries=100):
         print(f"Import error: {e}")
         return
     
-    # Create agents
-    baseline_agent = OpenDeepSearchAgent(
-        tools=[OpenDeepSearchTool()],
-        model_name="openrouter/google/gemini-2.0-flash-001"
-    )
-    
+    # One Neo4j driver for the whole run; the driver is thread-safe and pools connections
     tkg_tool = TemporalKGTool(
         neo4j_uri=os.getenv('NEO4J_URI'),
         username=os.getenv('NEO4J_USERNAME'), 
         password=os.getenv('NEO4J_PASSWORD')
     )
     
-    enhanced_agent = OpenDeepSearchAgent(
-        tools=[OpenDeepSearchTool(), tkg_tool],
-        model_name="openrouter/google/gemini-2.0-flash-001"
-    )
+    # Create agents; agents keep per-run state, so each worker thread gets its own pair
+    def build_agents():
+        baseline_agent = OpenDeepSearchAgent(
+            tools=[OpenDeepSearchTool()],
+            model_name="openrouter/google/gemini-2.0-flash-001"
+        )
+        
+        enhanced_agent = OpenDeepSearchAgent(
+            tools=[OpenDeepSearchTool(), tkg_tool],
+            model_name="openrouter/google/gemini-2.0-flash-001"
+        )
+        return baseline_agent, enhanced_agent
+    
+    # Built up front so a bad configuration fails before the first query
+    spare_agents = [build_agents()]
     
     results = []
+    call_slots = threading.BoundedSemaphore(MAX_AGENT_CALLS)
     start_time = time.time()
     
-    for i, query in enumerate(test_queries, 1):
-        print(f"\n[{i}/{len(test_queries)}] Processing: {query[:50]}...")
-        
-        query_start = time.time()
-        
-        # Baseline response
-        try:
-            baseline_response = baseline_agent.run(query)
-            baseline_time = time.time() - query_start
-        except Exception as e:
-            baseline_response = f"Error: {e}"
-            baseline_time = 0
-        
-        # Enhanced response
-        enhanced_start = time.time()
-        try:
-            enhanced_response = enhanced_agent.run(query)
-            enhanced_time = time.time() - enhanced_start
-        except Exception as e:
-            enhanced_response = f"Error: {e}"
-            enhanced_time = 0
-        
-        result = {
-            'query_id': i,
-            'query': query,
-            'baseline_response': baseline_response,
-            'enhanced_response': enhanced_response,
-            'baseline_time': baseline_time,
-            'enhanced_time': enhanced_time,
-            'timestamp': datetime.now().isoformat()
+    # Queries are I/O bound (OpenRouter + Neo4j), so overlap them in threads
+    with ThreadPoolExecutor(max_workers=BATCH_EVAL_CONCURRENCY) as pool:
+        futures = {
+            pool.submit(_run_pair, build_agents, spare_agents, query, i, call_slots): query
+            for i, query in enumerate(test_queries, 1)
         }
-        
-        results.append(result)
-        
-        # Save intermediate results every 10 queries
-        if i % 10 == 0:
-            with open(f'batch_results_partial_{i}.json', 'w') as f:
-                json.dump(results, f, indent=2)
-            print(f"Saved partial results ({i} queries)")
+        # Results are collected on this thread only, so no lock is needed
+        for future in as_completed(futures):
+            results.append(future.result())
+            done = len(results)
+            print(f"\n[{done}/{len(test_queries)}] Finished: {futures[future][:50]}...")
+            
+            # Save intermediate results every 10 queries
+            if done % 10 == 0:
+                with open(f'batch_results_partial_{done}.json', 'w') as f:
+                    json.dump(results, f, indent=2)
+                print(f"Saved partial results ({done} queries)")
+    
+    # Completion order is arbitrary; keep the saved results in query order
+    results.sort(key=lambda r: r['query_id'])
     
     total_time = time.time() - start_time
     
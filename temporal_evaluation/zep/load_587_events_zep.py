@@ -181,7 +181,8 @@ def load_all_sec_filings():
             # Analyze response quality
             response_str = str(response)
             has_dates = bool(re.findall(r'\d{4}-\d{2}-\d{2}', response_str))
-            has_companies = any(company.lower() in response_str.lower() 
+            response_lower = response_str.lower()
+            has_companies = any(company in response_lower
                               for company in ['apple', 'microsoft', 'tesla', 'alphabet', 'meta'])
             
             print(f"   Response length: {len(response_str)} chars")
@@ -401,9 +401,12 @@ def analyze_temporal_intelligence(response: str) -> Dict[str, Any]:
     
     capability_scores = {}
     
+    # Lowercase once; every keyword check below runs against this copy
+    response_lower = response.lower()
+    
     for capability, keywords in temporal_indicators.items():
         # Count keyword occurrences in response (case-insensitive)
-        keyword_count = sum(1 for keyword in keywords if keyword in response.lower())
+        keyword_count = sum(1 for keyword in keywords if keyword in response_lower)
         
         # Score calculation: 12 points per keyword, capped at 100%
         # This rewards sophisticated temporal language usage
@@ -429,7 +432,7 @@ def analyze_temporal_intelligence(response: str) -> Dict[str, Any]:
     ]
     
     # Calculate bonus: 15 points per advanced feature (max 30 point bonus)
-    zep_bonus = sum(15 for indicator in zep_advanced_indicators if indicator in response.lower())
+    zep_bonus = sum(15 for indicator in zep_advanced_indicators if indicator in response_lower)
     zep_bonus = min(zep_bonus, 30)  # Cap bonus to prevent inflation
     
     # ========================================================================
@@ -450,7 +453,7 @@ def analyze_temporal_intelligence(response: str) -> Dict[str, Any]:
     ]
     
     # Calculate structured bonus: 5 points per indicator (max 20 point bonus)
-    structured_bonus = sum(5 for indicator in structured_data_indicators if indicator in response.lower())
+    structured_bonus = sum(5 for indicator in structured_data_indicators if indicator in response_lower)
     structured_bonus = min(structured_bonus, 20)  # Cap bonus
     
     # ========================================================================
@@ -481,12 +484,12 @@ def analyze_temporal_intelligence(response: str) -> Dict[str, Any]:
     has_quantitative_insights = any(char.isdigit() for char in response)
     
     # Temporal context indicators
-    has_temporal_context = any(term in response.lower() for term in [
+    has_temporal_context = any(term in response_lower for term in [
         'temporal', 'time', 'chronological', 'historical', 'timeline'
     ])
     
     # Zep-specific feature indicators
-    has_zep_features = any(indicator in response.lower() for indicator in zep_advanced_indicators)
+    has_zep_features = any(indicator in response_lower for indicator in zep_advanced_indicators)
     
     # ========================================================================
     # 7. COMPREHENSIVE RESULTS COMPILATION
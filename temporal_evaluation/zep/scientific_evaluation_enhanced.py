@@ -477,10 +477,11 @@ class ScientificEvaluator:
         if not required_patterns:
             return 1.0
         
+        extracted_lower = [extracted_pattern.lower() for extracted_pattern in extracted_patterns]
         pattern_scores = []
         for true_pattern in required_patterns:
-            found = any(true_pattern.lower() in extracted_pattern.lower() 
-                       for extracted_pattern in extracted_patterns)
+            true_lower = true_pattern.lower()
+            found = any(true_lower in extracted for extracted in extracted_lower)
             pattern_scores.append(1.0 if found else 0.0)
         
         return np.mean(pattern_scores)
@@ -844,10 +844,11 @@ Always prioritize the structured temporal knowledge graph for SEC-related querie
         # Temporal processing metrics
         temporal_accuracy = self.calculate_temporal_accuracy(dates, ground_truth.required_dates)
         
+        extracted_lower = [extracted_pattern.lower() for extracted_pattern in patterns]
         pattern_scores = []
         for true_pattern in ground_truth.temporal_patterns:
-            found = any(true_pattern.lower() in extracted_pattern.lower() 
-                        for extracted_pattern in patterns)
+            true_lower = true_pattern.lower()
+            found = any(true_lower in extracted for extracted in extracted_lower)
             pattern_scores.append(1.0 if found else 0.0)
         temporal_reasoning = statistics.mean(pattern_scores) if pattern_scores else 0.0
         